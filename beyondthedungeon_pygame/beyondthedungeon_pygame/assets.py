@@ -0,0 +1,73 @@
+import os
+import threading
+import pygame
+from atlas import Atlas
+from bundle import BASE_DIR, abrir, chave_recurso
+
+
+class AssetManager:
+    """Imagens do jogo carregadas sob demanda, uma única vez, e compartilhadas por todos"""
+    def __init__(self, base_dir=BASE_DIR):
+        self.base_dir = base_dir
+        # (caminho absoluto, alpha) -> surface convertida, ou None se o arquivo falhou
+        self.imagens = {}
+        self.lock = threading.Lock()
+        # Índice do atlas, lido no primeiro acesso; sprites fora dele vêm dos arquivos soltos
+        self.atlas = None
+        self.hits = 0
+        self.misses = 0
+
+    def caminho(self, relative_path):
+        if os.path.isabs(relative_path):
+            return relative_path
+        return os.path.join(self.base_dir, relative_path)
+
+    def imagem(self, relative_path, alpha=True):
+        """Surface compartilhada da imagem; None se ela não puder ser carregada"""
+        chave = (self.caminho(relative_path), alpha)
+        if chave in self.imagens:
+            self.hits += 1
+            return self.imagens[chave]
+
+        with self.lock:
+            if chave in self.imagens:
+                self.hits += 1
+                return self.imagens[chave]
+            self.misses += 1
+            self.imagens[chave] = self.carregar(chave[0], alpha)
+            return self.imagens[chave]
+
+    def carregar(self, path, alpha):
+        if self.atlas is None:
+            self.atlas = Atlas(self.base_dir)
+        chave = chave_recurso(os.path.relpath(path, self.base_dir))
+        if alpha and chave in self.atlas:
+            try:
+                return self.atlas.sprite(chave)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"⚠ Atlas indisponível para {chave}, usando o arquivo solto ({e})")
+        try:
+            img = pygame.image.load(abrir(path), os.path.basename(path))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"⚠ Imagem não carregada: {path} ({e})")
+            return None
+        if pygame.display.get_surface() is None:
+            return img
+        return img.convert_alpha() if alpha else img.convert()
+
+    def memoria(self):
+        # Sprites do atlas são subsurfaces: a memória é a das folhas
+        soltas = [img for img in self.imagens.values() if img is not None and img.get_parent() is None]
+        folhas = list(self.atlas.folhas.values()) if self.atlas else []
+        return sum(img.get_width() * img.get_height() * img.get_bytesize() for img in soltas + folhas)
+
+    def estatisticas(self):
+        return {
+            "imagens": len(self.imagens),
+            "hits": self.hits,
+            "misses": self.misses,
+            "memoria_kb": self.memoria() // 1024,
+        }
+
+
+assets = AssetManager()
@@ -0,0 +1,123 @@
+"""Atlas de sprites: gera e lê as imagens empacotadas em assets/atlas.
+
+Cada sprite é guardado no tamanho em que o jogo o desenha, então o atlas
+substitui o arquivo solto sem mudar nenhum pixel na tela.
+
+Para gerar (ou atualizar depois de mudar algum sprite):
+    python atlas.py
+"""
+import os
+import json
+import pygame
+from bundle import BASE_DIR, abrir, chave_recurso, existe, ler
+
+ATLAS_DIR = os.path.join("assets", "atlas")
+ATLAS_INDEX = "atlas.json"
+ATLAS_VERSAO = 1
+LARGURA_MAXIMA = 1024
+
+# grupo -> (pasta de origem, tamanho em jogo; None mantém o original)
+GRUPOS = {
+    "items": (os.path.join("assets", "sprites", "items"), (32, 32)),
+    "enemies": (os.path.join("assets", "sprites", "enemies"), (96, 96)),
+    "player": (os.path.join("assets", "sprites", "player"), None),
+}
+
+
+def empacotar(tamanhos, largura_maxima=LARGURA_MAXIMA):
+    """Empacotamento em prateleiras: posições (x, y) e o tamanho final do atlas"""
+    ordem = sorted(range(len(tamanhos)), key=lambda i: tamanhos[i][1], reverse=True)
+    posicoes = [None] * len(tamanhos)
+    x = y = altura_prateleira = largura = 0
+    for i in ordem:
+        w, h = tamanhos[i]
+        if x + w > largura_maxima and x > 0:
+            x, y = 0, y + altura_prateleira
+            altura_prateleira = 0
+        posicoes[i] = (x, y)
+        x += w
+        largura = max(largura, x)
+        altura_prateleira = max(altura_prateleira, h)
+    return posicoes, (largura, y + altura_prateleira)
+
+
+def construir_atlas(base_dir=BASE_DIR):
+    destino = os.path.join(base_dir, ATLAS_DIR)
+    os.makedirs(destino, exist_ok=True)
+    indice = {"versao": ATLAS_VERSAO, "atlas": {}, "sprites": {}}
+
+    for grupo, (pasta, tamanho) in GRUPOS.items():
+        caminhos = []
+        for raiz, _, arquivos in os.walk(os.path.join(base_dir, pasta)):
+            caminhos.extend(os.path.join(raiz, a) for a in arquivos if a.lower().endswith(".png"))
+        caminhos.sort()
+        if not caminhos:
+            continue
+
+        sprites = []
+        for path in caminhos:
+            img = pygame.image.load(path)
+            if tamanho and img.get_size() != tamanho:
+                img = pygame.transform.scale(img, tamanho)
+            sprites.append(img)
+
+        posicoes, tamanho_atlas = empacotar([s.get_size() for s in sprites])
+        folha = pygame.Surface(tamanho_atlas, pygame.SRCALPHA, 32)
+        folha.blits([(s, pos) for s, pos in zip(sprites, posicoes)], doreturn=False)
+        arquivo = f"{grupo}.png"
+        pygame.image.save(folha, os.path.join(destino, arquivo))
+
+        indice["atlas"][grupo] = arquivo
+        for path, img, (x, y) in zip(caminhos, sprites, posicoes):
+            chave = chave_recurso(os.path.relpath(path, base_dir))
+            indice["sprites"][chave] = {"atlas": grupo, "rect": [x, y, img.get_width(), img.get_height()]}
+        print(f"✓ Atlas {grupo}: {len(sprites)} sprites em {tamanho_atlas[0]}x{tamanho_atlas[1]}")
+
+    with open(os.path.join(destino, ATLAS_INDEX), "w", encoding="utf-8") as f:
+        json.dump(indice, f, ensure_ascii=False, indent=1)
+    return indice
+
+
+class Atlas:
+    """Índice do atlas gerado; as folhas só são decodificadas no primeiro uso"""
+    def __init__(self, base_dir=BASE_DIR):
+        self.base_dir = base_dir
+        self.arquivos = {}
+        self.sprites = {}
+        self.folhas = {}
+        self.carregar_indice()
+
+    def carregar_indice(self):
+        path = os.path.join(self.base_dir, ATLAS_DIR, ATLAS_INDEX)
+        if not existe(path):
+            return
+        try:
+            indice = json.loads(bytes(ler(path)).decode("utf-8"))
+            if indice.get("versao") != ATLAS_VERSAO:
+                print("⚠ Atlas de sprites desatualizado, usando arquivos soltos")
+                return
+            self.arquivos = indice["atlas"]
+            self.sprites = indice["sprites"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠ Índice do atlas inválido, usando arquivos soltos: {e}")
+
+    def __contains__(self, chave):
+        return chave in self.sprites
+
+    def folha(self, grupo):
+        if grupo not in self.folhas:
+            img = pygame.image.load(abrir(os.path.join(self.base_dir, ATLAS_DIR, self.arquivos[grupo])), self.arquivos[grupo])
+            if pygame.display.get_surface() is not None:
+                img = img.convert_alpha()
+            self.folhas[grupo] = img
+        return self.folhas[grupo]
+
+    def sprite(self, chave):
+        """Subsurface do sprite dentro da folha, sem cópia de pixels"""
+        entrada = self.sprites[chave]
+        return self.folha(entrada["atlas"]).subsurface(entrada["rect"])
+
+
+if __name__ == "__main__":
+    pygame.init()
+    construir_atlas()
@@ -0,0 +1,199 @@
+"""Pacote único com os assets do jogo, lido por mmap.
+
+Formato: cabeçalho (magic, quantidade), índice de entradas
+(offset, tamanho, formato, nome) e os dados de cada arquivo em sequência.
+Quem pede um arquivo recebe uma view sobre o mmap, sem copiar o conteúdo;
+arquivos ausentes do pacote, ou editados depois dele, são lidos soltos do disco.
+
+Para gerar (ou atualizar depois de mudar algum asset):
+    python bundle.py
+"""
+import io
+import os
+import mmap
+import struct
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_PATH = os.path.join(BASE_DIR, "assets.pak")
+BUNDLE_MAGIC = b"BTDPAK1\0"
+BUNDLE_HEADER = struct.Struct("<8sI")
+BUNDLE_ENTRADA = struct.Struct("<QQ8sH")
+# Gerados em tempo de execução ou sem uso no jogo
+IGNORADOS = (".colmap", ".tmp", ".txt", ".url")
+
+
+def chave_recurso(path):
+    """Caminho relativo ao pacote com '/', usado como nome no índice"""
+    if os.path.isabs(path):
+        path = os.path.relpath(path, BASE_DIR)
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+class VisaoArquivo(io.RawIOBase):
+    """Arquivo somente leitura sobre um trecho do mmap"""
+    def __init__(self, dados):
+        super().__init__()
+        self.dados = dados
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        n = max(0, min(len(b), len(self.dados) - self.pos))
+        b[:n] = self.dados[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.pos
+        elif whence == io.SEEK_END:
+            offset += len(self.dados)
+        self.pos = max(0, offset)
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+
+class Bundle:
+    """Índice do pacote, mapeado só no primeiro acesso"""
+    def __init__(self, path=BUNDLE_PATH):
+        self.path = path
+        # nome -> (offset, tamanho, formato)
+        self.entradas = {}
+        self.mapa = None
+        self.mtime = 0.0
+        self.carregado = False
+        # Threads do DungeonLoader leem assets junto com o loop principal
+        self.lock = threading.Lock()
+
+    def carregar_indice(self):
+        with self.lock:
+            if self.carregado:
+                return
+            if os.path.exists(self.path):
+                self.abrir_pacote()
+            # Um pacote inválido também conta como carregado: o aviso sai uma vez só
+            self.carregado = True
+
+    def abrir_pacote(self):
+        mapa = None
+        try:
+            mtime = os.path.getmtime(self.path)
+            with open(self.path, 'rb') as f:
+                mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, quantidade = BUNDLE_HEADER.unpack_from(mapa, 0)
+            if magic != BUNDLE_MAGIC:
+                raise ValueError("magic inválido")
+            entradas = {}
+            pos = BUNDLE_HEADER.size
+            for _ in range(quantidade):
+                offset, tamanho, formato, tamanho_nome = BUNDLE_ENTRADA.unpack_from(mapa, pos)
+                pos += BUNDLE_ENTRADA.size
+                nome = mapa[pos:pos + tamanho_nome].decode("utf-8")
+                pos += tamanho_nome
+                entradas[nome] = (offset, tamanho, formato.rstrip(b"\0").decode("ascii"))
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠ Pacote de assets inválido, usando arquivos soltos: {e}")
+            if mapa is not None:
+                mapa.close()
+            return
+        self.mapa, self.mtime, self.entradas = mapa, mtime, entradas
+        print(f"✓ Pacote de assets carregado: {len(entradas)} arquivos")
+
+    def fechar(self):
+        """Solta o mmap; necessário antes de substituir o arquivo (no Windows ele fica travado)"""
+        with self.lock:
+            if self.mapa is not None:
+                self.mapa.close()
+            self.entradas = {}
+            self.mapa = None
+            self.carregado = False
+
+    def __contains__(self, nome):
+        if not self.carregado:
+            self.carregar_indice()
+        return nome in self.entradas
+
+    def dados(self, nome):
+        offset, tamanho, _ = self.entradas[nome]
+        return memoryview(self.mapa)[offset:offset + tamanho]
+
+    def formato(self, nome):
+        return self.entradas[nome][2]
+
+
+pacote = Bundle()
+
+
+def no_pacote(path):
+    """Chave do arquivo no pacote, ou None se ele não está lá ou o solto é mais novo"""
+    chave = chave_recurso(path)
+    if chave not in pacote:
+        return None
+    try:
+        # Durante o desenvolvimento o arquivo editado vale mais que o pacote antigo
+        if os.path.getmtime(os.path.join(BASE_DIR, path)) > pacote.mtime:
+            return None
+    except OSError:
+        pass
+    return chave
+
+
+def existe(path):
+    return no_pacote(path) is not None or os.path.exists(os.path.join(BASE_DIR, path))
+
+
+def abrir(path):
+    """Arquivo binário: view do pacote quando ele tem o arquivo, senão o arquivo solto"""
+    chave = no_pacote(path)
+    if chave is not None:
+        return VisaoArquivo(pacote.dados(chave))
+    return open(os.path.join(BASE_DIR, path), 'rb')
+
+
+def ler(path):
+    """Conteúdo inteiro; do pacote vem como memoryview, sem cópia"""
+    chave = no_pacote(path)
+    if chave is not None:
+        return pacote.dados(chave)
+    with open(os.path.join(BASE_DIR, path), 'rb') as f:
+        return f.read()
+
+
+def construir_bundle(base_dir=BASE_DIR, destino=BUNDLE_PATH):
+    arquivos = []
+    for raiz, _, nomes in os.walk(os.path.join(base_dir, "assets")):
+        for nome in nomes:
+            if not nome.endswith(IGNORADOS):
+                arquivos.append(os.path.join(raiz, nome))
+    arquivos.sort()
+
+    nomes = [chave_recurso(os.path.relpath(path, base_dir)).encode("utf-8") for path in arquivos]
+    offset = BUNDLE_HEADER.size + sum(BUNDLE_ENTRADA.size + len(n) for n in nomes)
+    tmp_path = destino + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, len(arquivos)))
+        tamanhos = [os.path.getsize(path) for path in arquivos]
+        for path, nome, tamanho in zip(arquivos, nomes, tamanhos):
+            formato = os.path.splitext(path)[1].lstrip(".").lower().encode("ascii")[:8]
+            f.write(BUNDLE_ENTRADA.pack(offset, tamanho, formato, len(nome)))
+            f.write(nome)
+            offset += tamanho
+        for path in arquivos:
+            with open(path, 'rb') as origem:
+                f.write(origem.read())
+    if os.path.abspath(destino) == os.path.abspath(pacote.path):
+        pacote.fechar()
+    os.replace(tmp_path, destino)
+    print(f"✓ Pacote de assets gerado: {len(arquivos)} arquivos, {offset // 1024} KB em {destino}")
+
+
+if __name__ == "__main__":
+    construir_bundle()
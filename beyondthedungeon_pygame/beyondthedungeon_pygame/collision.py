@@ -1,90 +1,284 @@
+import os
+import random
+import struct
+import hashlib
+import numpy as np
 import pygame
-from PIL import Image
+from bundle import BASE_DIR, VisaoArquivo, ler
+
+# Cabeçalho do cache compilado: magic, sha1 da imagem, tamanho, limiar
+CACHE_MAGIC = b"BTDCOL1\0"
+CACHE_HEADER = struct.Struct("<8s20sII")
+CACHE_EXT = ".colmap"
+
+def decode_map(image_path, dungeon_size=1280):
+    """Lê e decodifica o mapa uma única vez; serve para a tela e para a colisão"""
+    data = ler(image_path)
+    surface = pygame.image.load(VisaoArquivo(data), image_path)
+    # pixels3d e smoothscale só aceitam 24/32 bits; mapas com paleta chegam em 8
+    if surface.get_bitsize() < 24:
+        surface = surface.convert(24, 0)
+    if surface.get_size() != (dungeon_size, dungeon_size):
+        surface = pygame.transform.smoothscale(surface, (dungeon_size, dungeon_size))
+    return surface, hashlib.sha1(data).digest()
 
 class CollisionMap:
-    
-    def __init__(self, image_path, dungeon_size=1280):
+
+    def __init__(self, image_path, dungeon_size=1280, threshold=10, surface=None, source_hash=None):
         self.dungeon_size = dungeon_size
-        self.collision_data = None
-        self.load_collision_map(image_path)
-    
-    def load_collision_map(self, image_path):
+        self.threshold = threshold
+        # grid[y, x] é True quando o pixel é passável
+        self.grid = None
+        # integral[y, x] = paredes no retângulo [0, x) x [0, y)
+        self.integral = None
+        # (largura, altura, região) -> posições livres (xs, ys) na região
+        self.spawn_index = {}
+        # componentes conexas das posições livres para a caixa do jogador
+        self.component_size = (48, 48)
+        self.components = None
+        self.main_component = None
+        self.load_collision_map(image_path, surface, source_hash)
+        self.build_integral()
+
+    def load_collision_map(self, image_path, surface=None, source_hash=None):
         try:
-            img = Image.open(image_path).convert('RGB')
-            
-            if img.size != (self.dungeon_size, self.dungeon_size):
-                img = img.resize((self.dungeon_size, self.dungeon_size), Image.Resampling.LANCZOS)
-            
-            pixels = img.load()
-            
-            self.collision_data = {}
-            for y in range(self.dungeon_size):
-                for x in range(self.dungeon_size):
-                    r, g, b = pixels[x, y]
-                    is_black = (r < 10 and g < 10 and b < 10)
-                    self.collision_data[(x, y)] = not is_black
-            
+            if source_hash is None:
+                source_hash = hashlib.sha1(ler(image_path)).digest()
+
+            cache_path = os.path.join(BASE_DIR, image_path) + CACHE_EXT
+            self.grid = self.load_cache(cache_path, source_hash)
+            if self.grid is not None:
+                print(f"✓ Mapa de colisão carregado do cache: {cache_path}")
+                return
+
+            if surface is None:
+                surface, _ = decode_map(image_path, self.dungeon_size)
+
+            # pixels3d é uma view [x, y] do próprio buffer da surface, sem cópia
+            pixels = pygame.surfarray.pixels3d(surface)
+            self.grid = self.build_grid(pixels.transpose(1, 0, 2))
+            del pixels
+            self.save_cache(cache_path, source_hash)
+
             print(f"✓ Mapa de colisão carregado: {image_path}")
         except Exception as e:
             print(f"✗ Erro ao carregar mapa de colisão: {e}")
-            self.collision_data = {(x, y): True for x in range(self.dungeon_size) for y in range(self.dungeon_size)}
-    
+            self.grid = np.ones((self.dungeon_size, self.dungeon_size), dtype=bool)
+
+    def build_grid(self, pixels):
+        is_black = (pixels < self.threshold).all(axis=2)
+        return ~is_black
+
+    def build_integral(self):
+        walls = (~self.grid).astype(np.int32)
+        self.integral = np.zeros((self.dungeon_size + 1, self.dungeon_size + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(walls, axis=0), axis=1, out=self.integral[1:, 1:])
+
+    def load_cache(self, cache_path, source_hash):
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                magic, digest, size, threshold = CACHE_HEADER.unpack(f.read(CACHE_HEADER.size))
+            if magic != CACHE_MAGIC or digest != source_hash:
+                return None
+            if size != self.dungeon_size or threshold != self.threshold:
+                return None
+
+            total = size * size
+            packed = np.memmap(cache_path, dtype=np.uint8, mode='r', offset=CACHE_HEADER.size, shape=((total + 7) // 8,))
+            return np.unpackbits(packed, count=total).view(bool).reshape(size, size)
+        except Exception as e:
+            print(f"⚠ Cache de colisão inválido, recriando: {e}")
+            return None
+
+    def save_cache(self, cache_path, source_hash):
+        tmp_path = cache_path + ".tmp"
+        try:
+            # Instalado só com o assets.pak, a pasta do mapa não existe no disco
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(CACHE_HEADER.pack(CACHE_MAGIC, source_hash, self.dungeon_size, self.threshold))
+                f.write(np.packbits(self.grid).tobytes())
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠ Não foi possível salvar o cache de colisão: {e}")
+
+    def wall_count(self, x, y, width, height):
+        x0, y0 = max(0, x), max(0, y)
+        x1 = min(self.dungeon_size, x + width)
+        y1 = min(self.dungeon_size, y + height)
+        if x1 <= x0 or y1 <= y0:
+            return 0
+
+        s = self.integral
+        return int(s[y1, x1] - s[y0, x1] - s[y1, x0] + s[y0, x0])
+
     def is_passable(self, x, y, width=48, height=48):
-        if not self.collision_data:
+        if self.integral is None:
             return True
-        
-        check_points = [
-            (x, y),                          
-            (x + width - 1, y),             
-            (x, y + height - 1),            
-            (x + width - 1, y + height - 1), 
-            (x + width // 2, y),             
-            (x + width // 2, y + height - 1), 
-            (x, y + height // 2),           
-            (x + width - 1, y + height // 2),
-        ]
-        
-        for px, py in check_points:
-            px = max(0, min(px, self.dungeon_size - 1))
-            py = max(0, min(py, self.dungeon_size - 1))
-            
-            if not self.collision_data.get((px, py), True):
-                return False
-        
-        return True
-    
-    def find_spawn_point(self):
-        import random
-        
-        attempts = 0
-        max_attempts = 1000
-        
-        while attempts < max_attempts:
-            x = random.randint(100, self.dungeon_size - 150)
-            y = random.randint(self.dungeon_size - 300, self.dungeon_size - 100)
-            
-            if self.is_passable(x, y):
-                return (x, y)
-            
-            attempts += 1
-        
-        print("⚠ Usando posição de spawn padrão")
-        return (self.dungeon_size // 2 - 24, self.dungeon_size - 150)
-        
-    def find_boss_spawn_point(self):
-        import random
-        
-        attempts = 0
-        max_attempts = 500
-        
-        while attempts < max_attempts:
-            x = random.randint(100, self.dungeon_size - 150)
-            y = random.randint(50, self.dungeon_size // 4)
-            
-            if self.is_passable(x, y):
-                return (x, y)
-            
-            attempts += 1
-        
-        print("⚠ Usando posição de spawn padrão para boss")
-        return (self.dungeon_size // 2 - 24, 100)
\ No newline at end of file
+        return self.wall_count(x, y, width, height) == 0
+
+    def is_passable_many(self, xs, ys, widths=48, heights=48):
+        """Versão vetorizada de is_passable para várias caixas de uma vez"""
+        xs, ys = np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64)
+        if self.integral is None:
+            return np.ones(np.broadcast(xs, ys).shape, dtype=bool)
+
+        x0 = np.clip(xs, 0, self.dungeon_size)
+        y0 = np.clip(ys, 0, self.dungeon_size)
+        x1 = np.clip(xs + widths, x0, self.dungeon_size)
+        y1 = np.clip(ys + heights, y0, self.dungeon_size)
+
+        s = self.integral
+        return (s[y1, x1] - s[y0, x1] - s[y1, x0] + s[y0, x0]) == 0
+
+    def full_region(self, width, height):
+        return (0, self.dungeon_size - width, 0, self.dungeon_size - height)
+
+    def player_spawn_region(self):
+        return (100, self.dungeon_size - 150, self.dungeon_size - 300, self.dungeon_size - 100)
+
+    def boss_spawn_region(self):
+        return (100, self.dungeon_size - 150, 50, self.dungeon_size // 4)
+
+    def free_mask(self, width, height, region):
+        x_min, x_max, y_min, y_max = region
+        x_min, y_min = max(0, x_min), max(0, y_min)
+        x_max = min(x_max, self.dungeon_size - width)
+        y_max = min(y_max, self.dungeon_size - height)
+        if x_max < x_min or y_max < y_min:
+            return np.zeros((0, 0), dtype=bool), x_min, y_min
+
+        s = self.integral
+        rows_top, rows_bottom = slice(y_min, y_max + 1), slice(y_min + height, y_max + height + 1)
+        cols_left, cols_right = slice(x_min, x_max + 1), slice(x_min + width, x_max + width + 1)
+        walls = s[rows_bottom, cols_right] - s[rows_top, cols_right] - s[rows_bottom, cols_left] + s[rows_top, cols_left]
+        return walls == 0, x_min, y_min
+
+    def free_positions(self, width, height, region):
+        """Posições (canto superior esquerdo) onde a caixa cabe sem tocar paredes"""
+        key = (width, height, region)
+        if key not in self.spawn_index:
+            mask, x_min, y_min = self.free_mask(width, height, region)
+            ys, xs = np.nonzero(mask)
+            self.spawn_index[key] = (xs + x_min, ys + y_min)
+        return self.spawn_index[key]
+
+    def build_components(self):
+        """Rotula as componentes conexas (vizinhança 4) das posições livres do jogador"""
+        width, height = self.component_size
+        mask, _, _ = self.free_mask(width, height, self.full_region(width, height))
+        rows, cols = mask.shape
+        self.components = np.zeros(mask.shape, dtype=np.int32)
+        if not mask.any():
+            return
+
+        # Segmentos horizontais contínuos de posições livres, em ordem de linha
+        edges = np.diff(np.pad(mask, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+        run_row, run_start = np.nonzero(edges == 1)
+        _, run_end = np.nonzero(edges == -1)
+        n_runs = len(run_row)
+
+        # Segmentos de linhas vizinhas que se sobrepõem pertencem à mesma componente
+        stride = cols + 2
+        start_keys = run_row * stride + run_start
+        end_keys = run_row * stride + run_end
+        first = np.searchsorted(end_keys, (run_row - 1) * stride + run_start, side='right')
+        last = np.searchsorted(start_keys, (run_row - 1) * stride + run_end, side='left') - 1
+        counts = np.maximum(last - first + 1, 0)
+        edge_a = np.repeat(np.arange(n_runs), counts)
+        edge_b = np.repeat(first, counts) + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+
+        # Union-find vetorizado: liga raízes pela menor e comprime os caminhos
+        parent = np.arange(n_runs)
+        while True:
+            root_a, root_b = parent[edge_a], parent[edge_b]
+            pending = root_a != root_b
+            if not pending.any():
+                break
+            low = np.minimum(root_a[pending], root_b[pending])
+            high = np.maximum(root_a[pending], root_b[pending])
+            np.minimum.at(parent, high, low)
+            while True:
+                jumped = parent[parent]
+                if np.array_equal(jumped, parent):
+                    break
+                parent = jumped
+
+        _, run_label = np.unique(parent, return_inverse=True)
+        run_label = run_label.astype(np.int32) + 1
+
+        painted = np.zeros((rows, cols + 1), dtype=np.int32)
+        painted[run_row, run_start] = run_label
+        painted[run_row, run_end] = -run_label
+        self.components = np.cumsum(painted, axis=1, dtype=np.int32)[:, :cols]
+
+    def component_at(self, x, y):
+        if self.components is None:
+            self.build_components()
+        if 0 <= y < self.components.shape[0] and 0 <= x < self.components.shape[1]:
+            return int(self.components[y, x])
+        return 0
+
+    def connected(self, pos_a, pos_b):
+        component = self.component_at(*pos_a)
+        return component != 0 and component == self.component_at(*pos_b)
+
+    def find_main_component(self):
+        """Maior componente que alcança tanto a região do jogador quanto a do boss"""
+        if self.components is None:
+            self.build_components()
+
+        player_xs, player_ys = self.free_positions(48, 48, self.player_spawn_region())
+        boss_xs, boss_ys = self.free_positions(96, 96, self.boss_spawn_region())
+        common = np.intersect1d(self.components[player_ys, player_xs], self.components[boss_ys, boss_xs])
+        common = common[common > 0]
+        if len(common) == 0:
+            print("⚠ Spawn do jogador e do boss não estão conectados neste mapa")
+            return 0
+
+        sizes = np.bincount(self.components.ravel())
+        return int(common[np.argmax(sizes[common])])
+
+    def reachable_positions(self, width, height, region):
+        if self.main_component is None:
+            self.main_component = self.find_main_component()
+        xs, ys = self.free_positions(width, height, region)
+        if self.main_component == 0:
+            return xs, ys
+
+        key = (width, height, region, "alcançável")
+        if key not in self.spawn_index:
+            keep = self.components[ys, xs] == self.main_component
+            self.spawn_index[key] = (xs[keep], ys[keep])
+        return self.spawn_index[key]
+
+    def random_position(self, positions):
+        xs, ys = positions
+        if len(xs) == 0:
+            return None
+        i = random.randrange(len(xs))
+        return (int(xs[i]), int(ys[i]))
+
+    def pick_spawn(self, width, height, region, default, label):
+        pos = self.random_position(self.reachable_positions(width, height, region))
+        if pos is None:
+            print(f"⚠ Nenhuma posição livre na região de spawn {label}, usando o mapa inteiro")
+            pos = self.random_position(self.free_positions(width, height, self.full_region(width, height)))
+        if pos is None:
+            print(f"⚠ Mapa sem espaço livre para {label}, usando posição padrão")
+            pos = default
+        return pos
+
+    def warm_spawn_index(self):
+        self.reachable_positions(48, 48, self.player_spawn_region())
+        self.reachable_positions(96, 96, self.boss_spawn_region())
+
+    def find_spawn_point(self, width=48, height=48):
+        default = (self.dungeon_size // 2 - width // 2, self.dungeon_size - 150)
+        return self.pick_spawn(width, height, self.player_spawn_region(), default, "do jogador")
+
+    def find_boss_spawn_point(self, width=96, height=96):
+        default = (self.dungeon_size // 2 - width // 2, 100)
+        return self.pick_spawn(width, height, self.boss_spawn_region(), default, "do boss")
@@ -0,0 +1,97 @@
+import threading
+from assets import assets
+from collision import CollisionMap, decode_map
+from navigation import NavGrid
+from game_data import DUNGEONS, ENEMIES
+
+
+class DungeonCarregada:
+    """Dados decodificados de uma dungeon, prontos para entrar em jogo"""
+    def __init__(self, index):
+        self.index = index
+        self.imagem = None
+        self.imagem_convertida = False
+        self.collision_map = None
+        self.nav_grid = None
+        self.boss_sprite = None
+
+
+class CarregamentoDungeon:
+    def __init__(self, index):
+        self.index = index
+        self.progresso = 0.0
+        self.resultado = None
+        self.concluido = threading.Event()
+
+
+class DungeonLoader:
+    """Carrega dungeons em threads de fundo para o loop de jogo nunca esperar disco"""
+    def __init__(self, dungeon_size=1280):
+        self.dungeon_size = dungeon_size
+        self.carregamentos = {}
+        self.lock = threading.Lock()
+
+    def solicitar(self, index):
+        if not 0 <= index < len(DUNGEONS):
+            return None
+        with self.lock:
+            carregamento = self.carregamentos.get(index)
+            if carregamento is None:
+                carregamento = CarregamentoDungeon(index)
+                self.carregamentos[index] = carregamento
+                threading.Thread(target=self.carregar, args=(carregamento,), daemon=True).start()
+        return carregamento
+
+    def carregar(self, carregamento):
+        dados = DungeonCarregada(carregamento.index)
+        # Quem espera em obter()/pronto() precisa ser liberado mesmo se algo escapar
+        try:
+            self.preparar(DUNGEONS[carregamento.index], dados, carregamento)
+        except Exception as e:
+            print(f"✗ Erro ao carregar dungeon {carregamento.index}: {e}")
+        finally:
+            carregamento.resultado = dados
+            carregamento.progresso = 1.0
+            carregamento.concluido.set()
+
+    def preparar(self, dungeon, dados, carregamento):
+        source_hash = None
+        try:
+            dados.imagem, source_hash = decode_map(dungeon["arquivo"], self.dungeon_size)
+        except Exception as e:
+            print(f"✗ Erro ao carregar imagem da dungeon: {e}")
+        carregamento.progresso = 0.4
+
+        try:
+            dados.collision_map = CollisionMap(dungeon["arquivo"], self.dungeon_size, surface=dados.imagem, source_hash=source_hash)
+            dados.collision_map.warm_spawn_index()
+            dados.nav_grid = NavGrid(dados.collision_map)
+        except Exception as e:
+            print(f"✗ Erro ao preparar colisão da dungeon: {e}")
+        carregamento.progresso = 0.9
+
+        try:
+            dados.boss_sprite = assets.imagem(ENEMIES[dungeon["nome"]]["boss"]["sprite"])
+        except Exception as e:
+            print(f"✗ Erro ao carregar sprite do boss: {e}")
+
+    def progresso(self, index):
+        carregamento = self.carregamentos.get(index)
+        return carregamento.progresso if carregamento else 0.0
+
+    def pronto(self, index):
+        carregamento = self.carregamentos.get(index)
+        return carregamento is not None and carregamento.concluido.is_set()
+
+    def obter(self, index):
+        carregamento = self.solicitar(index)
+        if carregamento is None:
+            return None
+        carregamento.concluido.wait()
+        return carregamento.resultado
+
+    def manter_apenas(self, indices):
+        with self.lock:
+            for index in list(self.carregamentos):
+                if index not in indices and self.carregamentos[index].concluido.is_set():
+                    del self.carregamentos[index]
@@ -1,4 +1,5 @@
 import pygame
+from render_cache import fonte, render_texto
 
 
 class HUD:
@@ -7,8 +8,8 @@ class HUD:
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        self.font_tiny = pygame.font.Font("assets/BoldPixels.ttf", 18)
-        self.font_small = pygame.font.Font("assets/BoldPixels.ttf", 24)
+        self.font_tiny = fonte(18)
+        self.font_small = fonte(24)
         
         self.BLACK = (0, 0, 0)
         self.WHITE = (255, 255, 255)
@@ -19,14 +20,31 @@ class HUD:
         self.GREEN = (0, 255, 0)
         self.BLUE = (0, 0, 255)
         self.YELLOW = (255, 255, 0)
-    
+
+        # Camada retida com o HUD já composto; só é refeita quando a assinatura muda
+        self.camada = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self.areas = []
+        self.assinatura = None
+
     def draw_all(self, screen, player, dungeon_index, total_dungeons, mensagem_acao, mensagem_timer):
+        assinatura = (player.vida, player.vida_max, player.mana, player.mana_max,
+                      len(player.inventario.itens), player.inventario.capacidade,
+                      dungeon_index, total_dungeons, mensagem_acao if mensagem_timer > 0 else None)
+        if assinatura != self.assinatura:
+            self.assinatura = assinatura
+            self.camada.fill((0, 0, 0, 0))
+            self.areas = [(self.camada, area, area) for area in
+                          self.compor(self.camada, player, dungeon_index, total_dungeons, mensagem_acao, mensagem_timer)]
+        # Só as áreas ocupadas são copiadas; a camada é quase toda transparente
+        screen.blits(self.areas, doreturn=False)
+
+    def compor(self, screen, player, dungeon_index, total_dungeons, mensagem_acao, mensagem_timer):
         
         x_pos = 15
         y_pos = 15
         
-        texto_dungeon = self.font_tiny.render(f"Dungeon {dungeon_index + 1}/{total_dungeons}", True, self.GOLD)
-        screen.blit(texto_dungeon, (x_pos, y_pos))
+        texto_dungeon = render_texto(self.font_tiny, f"Dungeon {dungeon_index + 1}/{total_dungeons}", True, self.GOLD)
+        area_status = screen.blit(texto_dungeon, (x_pos, y_pos))
         
         vida_percent = max(0, player.vida / player.vida_max)
         cor_vida = self.GREEN if vida_percent > 0.5 else self.YELLOW if vida_percent > 0.25 else self.RED
@@ -41,8 +59,8 @@ class HUD:
             pygame.draw.rect(screen, cor_vida, (barra_x, barra_y, barra_filled, barra_height))
         pygame.draw.rect(screen, self.GOLD, (barra_x, barra_y, barra_width, barra_height), 1)
         
-        texto_hp_label = self.font_tiny.render("HP", True, self.WHITE)
-        screen.blit(texto_hp_label, (barra_x + barra_width + 8, barra_y + 1))
+        texto_hp_label = render_texto(self.font_tiny, "HP", True, self.WHITE)
+        area_status.union_ip(screen.blit(texto_hp_label, (barra_x + barra_width + 8, barra_y + 1)))
         
         mana_percent = max(0, player.mana / player.mana_max)
         
@@ -53,17 +71,18 @@ class HUD:
             pygame.draw.rect(screen, self.BLUE, (barra_x, barra_y_mana, barra_mana_filled, barra_height))
         pygame.draw.rect(screen, self.GOLD, (barra_x, barra_y_mana, barra_width, barra_height), 1)
         
-        texto_mp_label = self.font_tiny.render("MP", True, self.WHITE)
-        screen.blit(texto_mp_label, (barra_x + barra_width + 8, barra_y_mana + 1))
+        texto_mp_label = render_texto(self.font_tiny, "MP", True, self.WHITE)
+        area_status.union_ip(screen.blit(texto_mp_label, (barra_x + barra_width + 8, barra_y_mana + 1)))
         
-        texto_itens = self.font_tiny.render(f"Items: {len(player.inventario.itens)}/{player.inventario.capacidade}", True, self.YELLOW)
-        screen.blit(texto_itens, (x_pos, barra_y_mana + 25))
+        texto_itens = render_texto(self.font_tiny, f"Items: {len(player.inventario.itens)}/{player.inventario.capacidade}", True, self.YELLOW)
+        area_status.union_ip(screen.blit(texto_itens, (x_pos, barra_y_mana + 25)))
         
-        texto_atalhos = self.font_tiny.render("[I] Inv | [ESC] Menu | [R] Ranking", True, self.GRAY)
+        texto_atalhos = render_texto(self.font_tiny, "[I] Inv | [ESC] Menu | [R] Ranking", True, self.GRAY)
         texto_atalhos_rect = texto_atalhos.get_rect(center=(self.screen_width // 2, self.screen_height - 20))
-        screen.blit(texto_atalhos, texto_atalhos_rect)
+        areas = [area_status, screen.blit(texto_atalhos, texto_atalhos_rect)]
         
         if mensagem_timer > 0:
-            texto_msg = self.font_small.render(mensagem_acao, True, self.GOLD)
+            texto_msg = render_texto(self.font_small, mensagem_acao, True, self.GOLD)
             texto_msg_rect = texto_msg.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            screen.blit(texto_msg, texto_msg_rect)
+            areas.append(screen.blit(texto_msg, texto_msg_rect))
+        return areas
@@ -1,5 +1,6 @@
 import pygame
-import os
+from assets import assets
+from render_cache import escalar, fonte, overlay, render_texto
 
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -22,12 +23,9 @@ class Item:
 
     def carregar_sprite(self):
         if "sprite" in self.dados:
-            path = self.dados["sprite"]
-            if os.path.exists(path):
-                try:
-                    img = pygame.image.load(path).convert_alpha()
-                    return pygame.transform.scale(img, (32, 32))
-                except: pass
+            img = assets.imagem(self.dados["sprite"])
+            if img is not None:
+                return escalar(img, (32, 32))
         surf = pygame.Surface((32, 32))
         cor = RED if self.tipo == 'arma' else BLUE if self.tipo == 'armadura' else GREEN
         surf.fill(cor)
@@ -71,16 +69,9 @@ class InventarioUI:
         self.info_w = self.largura - (self.info_x - self.x) - 30
         self.info_h = 350
 
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        font_path = os.path.join(base_dir, "assets", "BoldPixels.ttf")
-        if os.path.exists(font_path):
-             self.font_title = pygame.font.Font(font_path, 40)
-             self.font_name = pygame.font.Font(font_path, 32)
-             self.font_desc = pygame.font.Font(font_path, 20)
-        else:
-             self.font_title = pygame.font.Font(None, 48)
-             self.font_name = pygame.font.Font(None, 36)
-             self.font_desc = pygame.font.Font(None, 24)
+        self.font_title = fonte(40, 48)
+        self.font_name = fonte(32, 36)
+        self.font_desc = fonte(20, 24)
         
         self.abas = ["Todos", "Armas", "Armaduras", "Magias", "Poções"]
         self.aba_selecionada = 0
@@ -156,15 +147,13 @@ class InventarioUI:
 
     def draw(self, screen):
         if not self.visivel: return
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(180); overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(overlay((self.screen_width, self.screen_height), BLACK, 180), (0, 0))
         
         rect = pygame.Rect(self.x, self.y, self.largura, self.altura)
         pygame.draw.rect(screen, DARK_GRAY, rect, border_radius=10)
         pygame.draw.rect(screen, GOLD, rect, 3, border_radius=10)
         
-        screen.blit(self.font_title.render("BOLSA", False, GOLD), (self.x+30, self.y+20))
+        screen.blit(render_texto(self.font_title, "BOLSA", False, GOLD), (self.x+30, self.y+20))
         
         ax = self.x + 30
         for i, aba in enumerate(self.abas):
@@ -172,11 +161,11 @@ class InventarioUI:
             ctx = BLACK if i==self.aba_selecionada else WHITE
             r = pygame.Rect(ax, self.y+60, 100, 30)
             pygame.draw.rect(screen, cbg, r, border_radius=5)
-            t = self.font_desc.render(aba, False, ctx)
+            t = render_texto(self.font_desc, aba, False, ctx)
             screen.blit(t, t.get_rect(center=r.center))
             ax += 110
             
-        screen.blit(self.font_desc.render("[TAB] Trocar Aba", False, GRAY), (ax+20, self.y+68))
+        screen.blit(render_texto(self.font_desc, "[TAB] Trocar Aba", False, GRAY), (ax+20, self.y+68))
 
         for i in range(24):
             c, r = i % self.cols, i // self.cols
@@ -191,7 +180,7 @@ class InventarioUI:
             if item.sprite:
                 sr = item.sprite.get_rect(center=(sx+32, sy+32))
                 if sr.w < 33:
-                    sc = pygame.transform.scale(item.sprite, (48, 48))
+                    sc = escalar(item.sprite, (48, 48))
                     screen.blit(sc, sc.get_rect(center=(sx+32, sy+32)))
                 else: screen.blit(item.sprite, sr)
             if i == self.item_selecionado:
@@ -202,8 +191,8 @@ class InventarioUI:
         
         if self.itens_aba and len(self.itens_aba) > 0:
             sel = self.itens_aba[self.item_selecionado]
-            screen.blit(self.font_name.render(sel.nome, False, GOLD), (self.info_x+15, self.info_y+15))
-            screen.blit(self.font_desc.render(f"Tipo: {sel.tipo}", False, GRAY), (self.info_x+15, self.info_y+50))
+            screen.blit(render_texto(self.font_name, sel.nome, False, GOLD), (self.info_x+15, self.info_y+15))
+            screen.blit(render_texto(self.font_desc, f"Tipo: {sel.tipo}", False, GRAY), (self.info_x+15, self.info_y+50))
             pygame.draw.line(screen, GRAY, (self.info_x+10, self.info_y+80), (self.info_x+self.info_w-10, self.info_y+80))
             
             sy = self.info_y + 90
@@ -213,11 +202,11 @@ class InventarioUI:
                 if k in ["ataque", "dano"]: ck = RED
                 elif k in ["defesa"]: ck = BLUE
                 elif k in ["cura"]: ck = GREEN
-                screen.blit(self.font_desc.render(f"{k.capitalize()}: {v}", False, ck), (self.info_x+15, sy))
+                screen.blit(render_texto(self.font_desc, f"{k.capitalize()}: {v}", False, ck), (self.info_x+15, sy))
                 sy += 30
             
             if sel.sprite:
-                li = pygame.transform.scale(sel.sprite, (128, 128))
+                li = escalar(sel.sprite, (128, 128))
                 img_x = self.info_x + (self.info_w // 2) - 64
                 img_y = self.info_y + self.info_h - 140 
                 
@@ -227,6 +216,6 @@ class InventarioUI:
                 
                 screen.blit(li, (img_x, img_y))
         else:
-            screen.blit(self.font_desc.render("Vazio", False, GRAY), (self.info_x+20, self.info_y+50))
+            screen.blit(render_texto(self.font_desc, "Vazio", False, GRAY), (self.info_x+20, self.info_y+50))
             
-        screen.blit(self.font_desc.render("[Setas] Navegar | [ENTER] Usar | [I] Fechar", False, WHITE), (self.x+200, self.y+470))
\ No newline at end of file
+        screen.blit(render_texto(self.font_desc, "[Setas] Navegar | [ENTER] Usar | [I] Fechar", False, WHITE), (self.x+200, self.y+470))
\ No newline at end of file
@@ -1,17 +1,25 @@
-import pplay
+import time
+INICIO_PROCESSO = time.perf_counter()
 import pygame
 import random
-import time
 import math
 import os
 from enum import Enum
+from functools import lru_cache
 from game_data import DUNGEONS, ENEMIES, WEAPONS, ARMORS, SPELLS, POTIONS, CONSUMABLES, DROPS
 from inventory import Inventario, InventarioUI, Item
 from settings import Configuracoes, TelaConfiguracao
-from collision import CollisionMap
+from assets import assets
+from bundle import abrir, existe
+from dungeon_loader import DungeonCarregada, DungeonLoader
+from navigation import FlowField
+from scheduler import Scheduler
+from spatial import SpatialHash
 from ranking import RankingManager, RankingUI
 from hud import HUD
+from render_cache import escalar, fonte, fontes, overlay, overlays, render_texto
 
+@lru_cache(maxsize=256)
 def truncate_text(text, max_width, font):
     if font.size(text)[0] <= max_width:
         return text
@@ -19,13 +27,25 @@ def truncate_text(text, max_width, font):
         text = text[:-1]
     return text + "..." if len(text) > 0 else "..."
 
+FIM_IMPORTS = time.perf_counter()
 pygame.init()
 pygame.mixer.init()
+FIM_PYGAME_INIT = time.perf_counter()
 
 VIRTUAL_WIDTH = 1280
 VIRTUAL_HEIGHT = 720
 DUNGEON_SIZE = 1280
 FPS = 60
+# Durações em segundos
+DURACAO_ANIMACAO = 1.0
+PAUSA_TURNO_INIMIGO = 0.5
+DURACAO_MENSAGEM = 2.0
+DURACAO_MENSAGEM_DROP = 3.0
+DURACAO_TRANSICAO = 3.0
+# A transição só pode ser pulada depois deste tempo
+TRANSICAO_MINIMA = 1.0
+# Espera após o último VIDEORESIZE antes de recriar a janela
+RESIZE_DEBOUNCE_MS = 250
 
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -51,6 +71,10 @@ class GameState(Enum):
     TRANSITION = 8
     PAUSED = 9
 
+# Estados cuja tela só muda por input ou por contadores lentos
+ESTADOS_ESTATICOS = {GameState.MENU, GameState.SETTINGS, GameState.PAUSED, GameState.TRANSITION, GameState.GAME_OVER, GameState.VICTORY}
+TELA_INTEIRA = (0, 0, VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
+
 class TipoDano(Enum):
     NORMAL = 1
     CRITICO = 2
@@ -64,19 +88,19 @@ class SoundManager:
         self.music_volume = 0.5
         self.sfx_volume = 0.5
         self.current_music = None
-        self.base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        self.load_sound("hit", "assets/audio/sfx/hit.wav")
-        self.load_sound("sword", "assets/audio/sfx/sword.wav")
-        self.load_sound("select", "assets/audio/sfx/select.wav")
-        self.load_sound("magic", "assets/audio/sfx/magic.wav")
-        self.load_sound("equip", "assets/audio/sfx/select.wav")
+        # Cada efeito só é decodificado na primeira vez que toca
+        self.sons_pendentes = {
+            "hit": "assets/audio/sfx/hit.wav",
+            "sword": "assets/audio/sfx/sword.wav",
+            "select": "assets/audio/sfx/select.wav",
+            "magic": "assets/audio/sfx/magic.wav",
+            "equip": "assets/audio/sfx/select.wav",
+        }
         
     def load_sound(self, name, relative_path):
-        full_path = os.path.join(self.base_dir, relative_path)
-        if os.path.exists(full_path):
+        if existe(relative_path):
             try:
-                sound = pygame.mixer.Sound(full_path)
+                sound = pygame.mixer.Sound(file=abrir(relative_path))
                 sound.set_volume(self.sfx_volume)
                 self.sounds[name] = sound
             except: pass
@@ -100,6 +124,8 @@ class SoundManager:
                 s.set_volume(self.sfx_volume)
 
     def play_sound(self, name):
+        if name in self.sons_pendentes:
+            self.load_sound(name, self.sons_pendentes.pop(name))
         if name in self.sounds:
             self.sounds[name].set_volume(self.sfx_volume)
             self.sounds[name].play()
@@ -110,8 +136,8 @@ class SoundManager:
         found = False
         
         for ext in extensions:
-            test_path = os.path.join(self.base_dir, f"assets/audio/music/{relative_path}{ext}")
-            if os.path.exists(test_path):
+            test_path = f"assets/audio/music/{relative_path}{ext}"
+            if existe(test_path):
                 full_path = test_path
                 found = True
                 break
@@ -122,7 +148,7 @@ class SoundManager:
             return
         
         try:
-            pygame.mixer.music.load(full_path)
+            pygame.mixer.music.load(abrir(full_path), os.path.basename(full_path))
             pygame.mixer.music.set_volume(self.music_volume)
             pygame.mixer.music.play(-1)
             self.current_music = full_path
@@ -172,6 +198,23 @@ class Character:
     def esta_vivo(self):
         return self.vida > 0
 
+class RelatorioInicio:
+    """Tempo de cada etapa da inicialização, até o primeiro frame do menu"""
+    def __init__(self, inicio):
+        self.inicio = inicio
+        self.ultimo = inicio
+        self.etapas = []
+
+    def marcar(self, etapa, agora=None):
+        agora = agora or time.perf_counter()
+        self.etapas.append((etapa, agora - self.ultimo))
+        self.ultimo = agora
+
+    def imprimir(self):
+        print(f"⏱ Inicialização: {(self.ultimo - self.inicio) * 1000:.0f} ms até o primeiro frame do menu")
+        for etapa, duracao in self.etapas:
+            print(f"   {etapa:<20}{duracao * 1000:6.0f} ms")
+
 class InputManager:
     def __init__(self):
         self.last_key_press = {}
@@ -220,27 +263,21 @@ class Player(Character):
     
     def load_sprites(self):
         try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
             mapeamento = {"walk_back": "up", "walk_front": "left", "walk_side": "right"}
 
             for arquivo, chave_direcao in mapeamento.items():
                 frames = []
                 for i in range(1, 5): 
-                    path = os.path.join(base_dir, f"assets/sprites/player/{arquivo}_{i}.png")
-                    try:
-                        img = pygame.image.load(path).convert_alpha()
-                        img = pygame.transform.scale(img, (48, 48))
-                        frames.append(img)
-                    except: pass
+                    img = assets.imagem(f"assets/sprites/player/{arquivo}_{i}.png")
+                    if img is not None:
+                        frames.append(escalar(img, (48, 48)))
                 if frames: self.sprite_frames[chave_direcao] = frames
                 else: self.sprite_frames[chave_direcao] = [pygame.Surface((48, 48))]
 
-            path_frente = os.path.join(base_dir, "assets/sprites/player/walk_front_1.png")
-            try:
-                img_frente = pygame.image.load(path_frente).convert_alpha()
-                img_frente = pygame.transform.scale(img_frente, (48, 48))
-                self.sprite_frames["down"] = [img_frente]
-            except: self.sprite_frames["down"] = [pygame.Surface((48, 48))]
+            img_frente = assets.imagem("assets/sprites/player/walk_front_1.png")
+            if img_frente is not None:
+                self.sprite_frames["down"] = [escalar(img_frente, (48, 48))]
+            else: self.sprite_frames["down"] = [pygame.Surface((48, 48))]
 
             self.sprite = self.sprite_frames["down"][0]
         except: pass
@@ -294,21 +331,25 @@ class Player(Character):
         screen.blit(self.sprite, (self.x - camera_x, self.y - camera_y))
 
 class Enemy(Character):
-    def __init__(self, dados):
+    def __init__(self, dados, imagem=None):
         super().__init__(dados["nome"], dados["vida"], dados["ataque"], dados["defesa"])
         self.sprite_path = dados["sprite"]
-        self.load_sprite()
+        self.load_sprite(imagem)
     
-    def load_sprite(self):
-        try:
-            self.sprite = pygame.image.load(self.sprite_path).convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (96, 96))
-        except:
+    def load_sprite(self, imagem=None):
+        if imagem is None: imagem = assets.imagem(self.sprite_path)
+        if imagem is not None:
+            self.sprite = escalar(imagem, (96, 96))
+        else:
             self.sprite = pygame.Surface((96, 96))
             self.sprite.fill(RED)
 
 class Combat:
-    def __init__(self, player, enemy, dificuldade="Normal", dungeon_nome="Caverna", sound_manager=None):
+    # (largura, altura, dungeon) -> fundo estático pré-renderizado
+    fundos = {}
+    MAX_FUNDOS = 2
+
+    def __init__(self, player, enemy, dificuldade="Normal", dungeon_nome="Caverna", sound_manager=None, agenda=None):
         self.player = player
         self.enemy = enemy
         self.dungeon_nome = dungeon_nome
@@ -316,7 +357,9 @@ class Combat:
         self.turno = "player"
         self.log = []
         self.log.append(f"Um {self.enemy.nome} hostil apareceu!")
-        self.animacao_timer = 0
+        # Sequência de turnos e animações; nada no combate espera bloqueando o loop
+        self.agenda = agenda if agenda is not None else Scheduler()
+        self.animacao_fim = 0.0
         self.mostrar_dano = False
         self.dano_mostrado = 0
         self.dano_tipo = TipoDano.NORMAL
@@ -344,6 +387,25 @@ class Combat:
         self.magias_disponiveis = [i.nome for i in self.player.inventario.itens if i.tipo == "magia"]
         self.pocoes_disponiveis = [i.nome for i in self.player.inventario.itens if i.tipo == "pocao"]
 
+    def iniciar_animacao(self):
+        self.animacao_fim = self.agenda.agora() + DURACAO_ANIMACAO
+
+    def animacao_restante(self):
+        return max(0.0, self.animacao_fim - self.agenda.agora())
+
+    def encerrar_turno_player(self):
+        """Fecha o menu e agenda o inimigo para depois da animação e de uma pausa"""
+        self.turno = "player"
+        self.em_menu = False
+        self.agenda.agendar(self.animacao_restante() + PAUSA_TURNO_INIMIGO, self.turno_inimigo)
+
+    def turno_inimigo(self):
+        if not self.enemy.esta_vivo():
+            return
+        self.turno = "enemy"
+        self.ataque_inimigo()
+        self.em_menu = True
+
     def calcular_dano(self, ataque):
         return ataque + random.randint(-2, 3)
     
@@ -364,8 +426,8 @@ class Combat:
         self.log.append(mensagem)
         self.mostrar_dano = True
         self.dano_mostrado = dano_base
-        self.animacao_timer = 60
-        self.em_menu = False
+        self.iniciar_animacao()
+        self.encerrar_turno_player()
     
     def ataque_inimigo(self):
         if random.random() < 0.30:
@@ -386,7 +448,7 @@ class Combat:
         self.log.append(f"{msg} Dano recebido: {dano_final}")
         self.mostrar_dano = True
         self.dano_mostrado = dano_final
-        self.animacao_timer = 60
+        self.iniciar_animacao()
     
     def usar_magia(self, magia_nome):
         if magia_nome in SPELLS:
@@ -407,8 +469,8 @@ class Combat:
                 
                 if self.sound_manager: self.sound_manager.play_sound("magic")
                 self.mostrar_dano = True
-                self.animacao_timer = 60
-                self.em_menu = False
+                self.iniciar_animacao()
+                self.encerrar_turno_player()
                 return True
             else:
                 self.log.append("Mana insuficiente!")
@@ -433,7 +495,7 @@ class Combat:
                 self.dano_tipo = TipoDano.CURA
                 self.dano_mostrado = dados["cura"]
                 self.mostrar_dano = True
-                self.animacao_timer = 60
+                self.iniciar_animacao()
                 used = True
             
             if "mana" in dados:
@@ -448,14 +510,14 @@ class Combat:
                 self.dano_tipo = TipoDano.ESPECIAL
                 self.dano_mostrado = dano_final
                 self.mostrar_dano = True
-                self.animacao_timer = 60
+                self.iniciar_animacao()
                 used = True
 
             if used:
                 self.player.inventario.remover_item(idx)
                 self.atualizar_listas()
                 if self.sound_manager: self.sound_manager.play_sound("magic")
-                self.em_menu = False
+                self.encerrar_turno_player()
                 return True
         return False
 
@@ -464,7 +526,7 @@ class Combat:
             self.log.append("Escapou com sucesso!")
             return True
         self.log.append("Fuga falhou!")
-        self.em_menu = False
+        self.encerrar_turno_player()
         return False
 
     def gerar_drops(self):
@@ -489,24 +551,50 @@ class Combat:
                 drops_gerados.append((tipo_escolhido, item_nome))
         return drops_gerados
 
-    def draw(self, screen, font_small, font_medium, font_large):
-        w, h = screen.get_width(), screen.get_height()
-        
+    def obter_fundo(self, w, h):
+        chave = (w, h, self.dungeon_nome)
+        fundo = Combat.fundos.get(chave)
+        if fundo is None:
+            fundo = self.construir_fundo(w, h)
+            if len(Combat.fundos) >= Combat.MAX_FUNDOS:
+                Combat.fundos.pop(next(iter(Combat.fundos)))
+            Combat.fundos[chave] = fundo
+        return fundo
+
+    def construir_fundo(self, w, h):
+        fundo = pygame.Surface((w, h)).convert()
         for y in range(h):
             c = int(20 + (y / h) * 40)
-            pygame.draw.line(screen, (c, c, c+10), (0, y), (w, y))
+            pygame.draw.line(fundo, (c, c, c+10), (0, y), (w, y))
         
-        pygame.draw.ellipse(screen, (10, 10, 15), (w*0.6, h*0.35, 400, 100))
-        pygame.draw.ellipse(screen, (10, 10, 15), (w*0.1, h*0.55, 400, 100))
+        pygame.draw.ellipse(fundo, (10, 10, 15), (w*0.6, h*0.35, 400, 100))
+        pygame.draw.ellipse(fundo, (10, 10, 15), (w*0.1, h*0.55, 400, 100))
+
+        self.draw_unit_frame(fundo, 50, 50)
+
+        panel_h = 180
+        panel_y = h - panel_h
+        s = pygame.Surface((w, panel_h), pygame.SRCALPHA)
+        pygame.draw.rect(s, self.PANEL_BG, s.get_rect())
+        fundo.blit(s, (0, panel_y))
+        pygame.draw.line(fundo, self.BORDER_COLOR, (0, panel_y), (w, panel_y), 4)
+
+        log_x = 320 + 40
+        pygame.draw.line(fundo, self.BORDER_COLOR, (log_x - 20, panel_y + 20), (log_x - 20, panel_y + panel_h - 20), 2)
+        return fundo
+
+    def draw(self, screen, font_small, font_medium, font_large):
+        w, h = screen.get_width(), screen.get_height()
+        screen.blit(self.obter_fundo(w, h), (0, 0))
 
         if self.enemy.sprite:
-            enemy_scale = pygame.transform.scale(self.enemy.sprite, (250, 250))
+            enemy_scale = escalar(self.enemy.sprite, (250, 250))
             enemy_rect = enemy_scale.get_rect(center=(w * 0.75, h * 0.35))
             screen.blit(enemy_scale, enemy_rect)
 
         if self.player.sprite_frames["down"]:
             player_sprite = self.player.sprite_frames["down"][0]
-            player_scale = pygame.transform.scale(player_sprite, (220, 220))
+            player_scale = escalar(player_sprite, (220, 220))
             player_rect = player_scale.get_rect(center=(w * 0.25, h * 0.55))
             screen.blit(player_scale, player_rect)
 
@@ -515,11 +603,6 @@ class Combat:
         panel_h = 180
         panel_y = h - panel_h
         
-        s = pygame.Surface((w, panel_h), pygame.SRCALPHA)
-        pygame.draw.rect(s, self.PANEL_BG, s.get_rect())
-        screen.blit(s, (0, panel_y))
-        pygame.draw.line(screen, self.BORDER_COLOR, (0, panel_y), (w, panel_y), 4)
-        
         stats_w = 320 
         self.draw_player_stats_panel(screen, 20, panel_y + 20, stats_w, panel_h - 40, font_medium, font_small)
         
@@ -532,16 +615,19 @@ class Combat:
         if self.em_menu:
             self.draw_action_menu(screen, menu_x, panel_y + 20, menu_w, panel_h - 40, font_medium)
 
-        if self.mostrar_dano and self.animacao_timer > 0:
-            offset_y = (60 - self.animacao_timer) * 3
-            font_dano = pygame.font.Font(None, int(60 + (self.animacao_timer/60)*20))
+        restante = self.animacao_restante()
+        if self.mostrar_dano and restante > 0:
+            # Sobe 180 px por segundo de animação
+            offset_y = (DURACAO_ANIMACAO - restante) * 180
+            # Tamanhos de 60 a 80 em passos de 4: poucas fontes, todas reaproveitadas
+            font_dano = fontes.obter(None, 60 + round(restante / DURACAO_ANIMACAO * 5) * 4)
             prefix = ""
             if self.dano_tipo == TipoDano.CURA: prefix = "+"
             txt = f"{prefix}{self.dano_mostrado}"
             color = GREEN if self.dano_tipo == TipoDano.CURA else self.dano_cor
             if self.dano_tipo == TipoDano.CRITICO: txt += "!"
-            dano_sombra = font_dano.render(txt, True, BLACK)
-            dano_text = font_dano.render(txt, True, color)
+            dano_sombra = render_texto(font_dano, txt, True, BLACK)
+            dano_text = render_texto(font_dano, txt, True, color)
             
             if self.turno == "player":
                 if self.dano_tipo == TipoDano.CURA: target_pos = (w * 0.25, h * 0.55 - 50)
@@ -552,14 +638,17 @@ class Combat:
             screen.blit(dano_sombra, (rect_dano.x+2, rect_dano.y+2))
             screen.blit(dano_text, rect_dano)
 
-    def draw_unit_hud(self, screen, unit, x, y, font, is_player):
+    def draw_unit_frame(self, screen, x, y):
         w, h = 350, 80
-        rect = pygame.Rect(x, y, w, h)
         s = pygame.Surface((w, h), pygame.SRCALPHA)
         pygame.draw.rect(s, self.PANEL_BG, s.get_rect(), border_radius=8)
         screen.blit(s, (x, y))
-        pygame.draw.rect(screen, self.BORDER_COLOR, rect, 2, border_radius=8)
-        name_txt = font.render(unit.nome, True, self.HIGHLIGHT_COLOR)
+        pygame.draw.rect(screen, self.BORDER_COLOR, pygame.Rect(x, y, w, h), 2, border_radius=8)
+
+    def draw_unit_hud(self, screen, unit, x, y, font, is_player):
+        # A moldura do painel faz parte do fundo pré-renderizado
+        w = 350
+        name_txt = render_texto(font, unit.nome, True, self.HIGHLIGHT_COLOR)
         screen.blit(name_txt, (x + 15, y + 10))
         bar_x = x + 15
         bar_y = y + 45
@@ -571,30 +660,29 @@ class Combat:
         pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_w, bar_h), 1)
 
     def draw_player_stats_panel(self, screen, x, y, w, h, font_name, font_bar):
-        name_txt = font_name.render(self.player.nome, True, self.HIGHLIGHT_COLOR)
+        name_txt = render_texto(font_name, self.player.nome, True, self.HIGHLIGHT_COLOR)
         screen.blit(name_txt, (x, y))
         hp_y = y + 50
         hp_pct = self.player.vida / self.player.vida_max
         pygame.draw.rect(screen, (50,0,0), (x, hp_y, w, 15))
         pygame.draw.rect(screen, RED if hp_pct < 0.3 else GREEN, (x, hp_y, w * hp_pct, 15))
         pygame.draw.rect(screen, GRAY, (x, hp_y, w, 15), 1)
-        hp_txt = font_bar.render(f"HP {int(self.player.vida)}/{self.player.vida_max}", True, WHITE)
+        hp_txt = render_texto(font_bar, f"HP {int(self.player.vida)}/{self.player.vida_max}", True, WHITE)
         screen.blit(hp_txt, (x, hp_y - 22))
         mp_y = y + 100
         mp_pct = self.player.mana / self.player.mana_max
         pygame.draw.rect(screen, (0,0,50), (x, mp_y, w, 15))
         pygame.draw.rect(screen, BLUE, (x, mp_y, w * mp_pct, 15))
         pygame.draw.rect(screen, GRAY, (x, mp_y, w, 15), 1)
-        mp_txt = font_bar.render(f"MP {int(self.player.mana)}/{self.player.mana_max}", True, WHITE)
+        mp_txt = render_texto(font_bar, f"MP {int(self.player.mana)}/{self.player.mana_max}", True, WHITE)
         screen.blit(mp_txt, (x, mp_y - 22))
 
     def draw_log_panel(self, screen, x, y, w, h, font):
-        pygame.draw.line(screen, self.BORDER_COLOR, (x - 20, y), (x - 20, y + h), 2)
         msgs = self.log[-4:]
         for i, msg in enumerate(msgs):
             col = WHITE if i == len(msgs)-1 else GRAY
             txt_str = truncate_text(msg, w, font)
-            txt = font.render(txt_str, True, col)
+            txt = render_texto(font, txt_str, True, col)
             screen.blit(txt, (x, y + i * 30))
 
     def draw_action_menu(self, screen, x, y, w, h, font):
@@ -611,55 +699,58 @@ class Combat:
             if i == self.opcao_selecionada:
                 color = self.HIGHLIGHT_COLOR
                 prefix = "> "
-            txt = font.render(prefix + op, True, color)
+            txt = render_texto(font, prefix + op, True, color)
             screen.blit(txt, (bx, by))
 
 class Game:
     def __init__(self):
+        self.relatorio_inicio = RelatorioInicio(INICIO_PROCESSO)
+        self.relatorio_inicio.marcar("imports", FIM_IMPORTS)
+        self.relatorio_inicio.marcar("pygame.init", FIM_PYGAME_INIT)
         self.configuracoes = Configuracoes()
+        self.brilho_aplicado = self.configuracoes.brilho
         self.virtual_surface = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
         self.screen = None
+        # Destino pré-alocado do present e tamanho de janela para o qual foi calculado
+        self.tela_escalada = None
+        self.present_rect = None
+        self.tamanho_janela = None
+        self.barras_pendentes = 0
+        self.resize_pendente = None
+        self.resize_ticks = 0
+        # Assinaturas das regiões no último frame parcial; None força um frame completo
+        self.regioes_desenhadas = None
+        self.contexto_desenhado = None
         self.aplicar_configuracoes()
         pygame.display.set_caption("Beyond the Dungeon")
         self.clock = pygame.time.Clock()
         self.running = True
         self.state = GameState.MENU
-        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.relatorio_inicio.marcar("janela")
         self.sound_manager = SoundManager()
         self.menu_background = None
-        bg_path = os.path.join(base_dir, "assets", "tiles", "fundo.png")
-        if os.path.exists(bg_path):
-            try:
-                img = pygame.image.load(bg_path).convert()
-                self.menu_background = pygame.transform.scale(img, (VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
-            except: pass
-        font_path = os.path.join(base_dir, "assets", "BoldPixels.ttf")
-        size_large, size_medium, size_small = 64, 32, 24
-        if os.path.exists(font_path):
-            try:
-                self.font_large = pygame.font.Font(font_path, size_large)
-                self.font_medium = pygame.font.Font(font_path, size_medium)
-                self.font_small = pygame.font.Font(font_path, size_small)
-            except:
-                self.font_large = pygame.font.Font(None, 72)
-                self.font_medium = pygame.font.Font(None, 48)
-                self.font_small = pygame.font.Font(None, 32)
-        else:
-            self.font_large = pygame.font.Font(None, 72)
-            self.font_medium = pygame.font.Font(None, 48)
-            self.font_small = pygame.font.Font(None, 32)
+        img = assets.imagem("assets/tiles/fundo.png", alpha=False)
+        if img is not None:
+            self.menu_background = pygame.transform.scale(img, (VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+        self.relatorio_inicio.marcar("fundo do menu")
+        self.font_large = fonte(64, 72)
+        self.font_medium = fonte(32, 48)
+        self.font_small = fonte(24, 32)
         self.input_manager = InputManager()
         self.tela_config = TelaConfiguracao(VIRTUAL_WIDTH, VIRTUAL_HEIGHT, self.configuracoes)
-        self.player = Player()
-        self.player.inventario.adicionar_item("Espada Básica", "arma", WEAPONS["Espada Básica"])
-        self.player.inventario.adicionar_item("Poção Cura Pequena", "pocao", POTIONS["Poção Cura Pequena"])
-        self.player.inventario.adicionar_item("Bola de Fogo", "magia", SPELLS["Bola de Fogo"])
-        self.player.equipamentos["arma"] = WEAPONS["Espada Básica"]
+        self.relatorio_inicio.marcar("fontes")
+        # Jogador e dungeon só são criados em "Jogar"; a dungeon 0 é pré-carregada após o primeiro frame
+        self.player = None
         self.dungeon_index = 0
+        self.dungeon_loader = DungeonLoader(DUNGEON_SIZE)
         self.dungeon_image = None
         self.collision_map = None
+        self.flow_field = None
+        self.entidades = SpatialHash()
         self.boss = None
         self.combate_atual = None
+        # Turnos agendados do combate; limpa junto quando o combate é descartado
+        self.agenda = Scheduler()
         self.camera_x = 0
         self.camera_y = 0
         self.menu_opcoes = ["Jogar", "Configuracoes", "Ranking", "Sair"]
@@ -669,15 +760,19 @@ class Game:
         self.ranking_manager = RankingManager()
         self.ranking_ui = RankingUI(VIRTUAL_WIDTH, VIRTUAL_HEIGHT)
         self.mensagem_acao = ""
-        self.mensagem_timer = 0
+        self.mensagem_ate = 0.0
         self.chance_combate = 0.015
         self.tempo_inicio = None
         self.inimigos_mortos = 0
         self.delta_time = 0
-        self.transition_timer = 0
+        self.transicao_fim = 0.0
+        # Dungeon que a transição vai abrir; a tela de carregamento do "Jogar" também passa por ela
+        self.destino_transicao = 0
+        self.inicio_novo_jogo = None
         self.nome_input = ""
+        self.relatorio_inicio.marcar("interfaces e ranking")
         self.sound_manager.play_music("menu_theme")
-        self.load_dungeon()
+        self.relatorio_inicio.marcar("música do menu")
     
     def aplicar_configuracoes(self):
         width, height = self.configuracoes.resolucao
@@ -685,28 +780,43 @@ class Game:
         if self.configuracoes.fullscreen:
             flags = pygame.FULLSCREEN | pygame.DOUBLEBUF
         self.screen = pygame.display.set_mode((width, height), flags)
+        self.tamanho_janela = None
+        overlays.limpar()
     
     def load_dungeon(self):
         if self.dungeon_index >= len(DUNGEONS):
             self.state = GameState.VICTORY
             return
         dungeon = DUNGEONS[self.dungeon_index]
-        try:
-            self.dungeon_image = pygame.image.load(dungeon["arquivo"]).convert()
-        except:
+        dados = self.dungeon_loader.obter(self.dungeon_index)
+        if dados is None:
+            dados = DungeonCarregada(self.dungeon_index)
+        if dados.imagem is not None and not dados.imagem_convertida:
+            dados.imagem = dados.imagem.convert()
+            if dados.imagem.get_size() != (DUNGEON_SIZE, DUNGEON_SIZE):
+                dados.imagem = pygame.transform.scale(dados.imagem, (DUNGEON_SIZE, DUNGEON_SIZE))
+            dados.imagem_convertida = True
+        if dados.imagem is not None:
+            self.dungeon_image = dados.imagem
+        else:
             self.dungeon_image = pygame.Surface((DUNGEON_SIZE, DUNGEON_SIZE))
             self.dungeon_image.fill(DARK_GRAY)
-        try:
-            self.collision_map = CollisionMap(dungeon["arquivo"])
-        except: self.collision_map = None
+        self.collision_map = dados.collision_map
+        # Campo de perseguição até o jogador, compartilhado pelos inimigos que andam
+        self.flow_field = FlowField(dados.nav_grid) if dados.nav_grid else None
         if self.collision_map:
             self.player.x, self.player.y = self.collision_map.find_spawn_point()
             boss_x, boss_y = self.collision_map.find_boss_spawn_point()
         else:
             self.player.x, self.player.y = DUNGEON_SIZE // 2, DUNGEON_SIZE - 150
             boss_x, boss_y = DUNGEON_SIZE // 2, 100
-        self.boss = Enemy(ENEMIES[dungeon["nome"]]["boss"])
+        self.boss = Enemy(ENEMIES[dungeon["nome"]]["boss"], dados.boss_sprite)
         self.boss.x, self.boss.y = boss_x, boss_y
+        self.entidades.limpar()
+        self.entidades.inserir(self.boss, (boss_x, boss_y, 96, 96))
+        # A primeira dungeon fica sempre pronta para um novo "Jogar"
+        self.dungeon_loader.manter_apenas({0, self.dungeon_index, self.dungeon_index + 1})
+        self.dungeon_loader.solicitar(self.dungeon_index + 1)
         if self.state != GameState.MENU: self.state = GameState.PLAYING
         if self.state == GameState.PLAYING:
             self.sound_manager.play_music("dungeon_ambient")
@@ -725,14 +835,28 @@ class Game:
         elif res == "aplicar": self.aplicar_configuracoes()
         self.sound_manager.update_volume(self.configuracoes.music_volume, self.configuracoes.sfx_volume, self.configuracoes.musica_ativada, self.configuracoes.efeitos_ativados)
 
+    def transicao_restante(self):
+        return max(0.0, self.transicao_fim - time.monotonic())
+
+    def iniciar_transicao(self, destino, duracao):
+        self.state = GameState.TRANSITION
+        self.destino_transicao = destino
+        self.transicao_fim = time.monotonic() + duracao
+        self.dungeon_loader.solicitar(destino)
+
     def handle_transition(self, keys):
-        if self.transition_timer > 0: self.transition_timer -= 1
-        if keys[pygame.K_RETURN] and self.transition_timer < 120: self.transition_timer = 0
-        if self.transition_timer <= 0:
-            self.dungeon_index += 1
+        if keys[pygame.K_RETURN] and self.transicao_restante() < DURACAO_TRANSICAO - TRANSICAO_MINIMA:
+            self.transicao_fim = time.monotonic()
+        destino = self.destino_transicao
+        carregada = destino >= len(DUNGEONS) or self.dungeon_loader.pronto(destino)
+        if self.transicao_restante() <= 0 and carregada:
+            self.dungeon_index = destino
             self.load_dungeon()
             if self.state != GameState.VICTORY:
                 self.state = GameState.PLAYING
+            if self.inicio_novo_jogo is not None:
+                print(f"⏱ Jogo pronto em {(time.perf_counter() - self.inicio_novo_jogo) * 1000:.0f} ms")
+                self.inicio_novo_jogo = None
 
     def handle_paused(self, keys):
         if self.input_manager.is_key_pressed(pygame.K_ESCAPE):
@@ -754,17 +878,7 @@ class Game:
         if self.input_manager.is_key_pressed(pygame.K_RETURN):
             self.sound_manager.play_sound("select")
             if self.menu_selecionado == 0:
-                self.tempo_inicio = time.time()
-                self.dungeon_index = 0
-                self.player = Player()
-                self.player.inventario.adicionar_item("Espada Básica", "arma", WEAPONS["Espada Básica"])
-                self.player.inventario.adicionar_item("Poção Cura Pequena", "pocao", POTIONS["Poção Cura Pequena"])
-                self.player.inventario.adicionar_item("Bola de Fogo", "magia", SPELLS["Bola de Fogo"])
-                self.player.equipamentos["arma"] = WEAPONS["Espada Básica"]
-                self.load_dungeon()
-                self.state = GameState.PLAYING
-                self.sound_manager.stop_music()
-                self.sound_manager.play_music("dungeon_ambient")
+                self.novo_jogo()
             elif self.menu_selecionado == 1:
                 self.state = GameState.SETTINGS
                 self.tela_config.visivel = True
@@ -773,11 +887,27 @@ class Game:
             elif self.menu_selecionado == 3:
                 self.running = False
 
+    def novo_jogo(self):
+        self.inicio_novo_jogo = time.perf_counter()
+        self.tempo_inicio = time.time()
+        self.dungeon_index = 0
+        self.player = Player()
+        self.player.inventario.adicionar_item("Espada Básica", "arma", WEAPONS["Espada Básica"])
+        self.player.inventario.adicionar_item("Poção Cura Pequena", "pocao", POTIONS["Poção Cura Pequena"])
+        self.player.inventario.adicionar_item("Bola de Fogo", "magia", SPELLS["Bola de Fogo"])
+        self.player.equipamentos["arma"] = WEAPONS["Espada Básica"]
+        self.encerrar_combate()
+        self.sound_manager.stop_music()
+        # Se a pré-carga da primeira dungeon ainda não terminou, a barra de transição
+        # acompanha o carregamento em vez de o loop esperar pelo disco
+        self.iniciar_transicao(0, 0.0)
+        self.handle_transition(pygame.key.get_pressed())
+
     def handle_playing(self, keys, dt):
         res = self.inventario_ui.handle_input(keys, self.player.inventario, self.player, self.input_manager)
         if res:
             self.mensagem_acao = res
-            self.mensagem_timer = 120
+            self.mensagem_ate = time.monotonic() + DURACAO_MENSAGEM
             if "Equipou" in res: self.sound_manager.play_sound("equip")
         if self.inventario_ui.visivel: return
         if self.input_manager.is_key_pressed(pygame.K_ESCAPE):
@@ -786,6 +916,7 @@ class Game:
         mov = self.player.update(keys, DUNGEON_SIZE, DUNGEON_SIZE, self.collision_map, self.input_manager)
         self.camera_x = max(0, min(self.player.x - VIRTUAL_WIDTH // 2, DUNGEON_SIZE - VIRTUAL_WIDTH))
         self.camera_y = max(0, min(self.player.y - VIRTUAL_HEIGHT // 2, DUNGEON_SIZE - VIRTUAL_HEIGHT))
+        if self.flow_field: self.flow_field.atualizar(self.player.x + 24, self.player.y + 24)
         
         # Lógica de Spawn com Delta Time
         if mov:
@@ -794,16 +925,18 @@ class Game:
                 dg_nome = DUNGEONS[self.dungeon_index]["nome"]
                 if ENEMIES[dg_nome]["regular"]:
                     en = Enemy(random.choice(ENEMIES[dg_nome]["regular"]))
-                    self.combate_atual = Combat(self.player, en, self.configuracoes.dificuldade, dg_nome, self.sound_manager)
+                    self.combate_atual = Combat(self.player, en, self.configuracoes.dificuldade, dg_nome, self.sound_manager, self.agenda)
                     self.state = GameState.COMBAT
 
-        boss_rect = pygame.Rect(self.boss.x, self.boss.y, 96, 96)
-        if pygame.Rect(self.player.x, self.player.y, 48, 48).colliderect(boss_rect):
-            dg_nome = DUNGEONS[self.dungeon_index]["nome"]
-            self.combate_atual = Combat(self.player, Enemy(ENEMIES[dg_nome]["boss"]), self.configuracoes.dificuldade, dg_nome, self.sound_manager)
-            self.state = GameState.COMBAT
+        for entidade in self.entidades.consultar((self.player.x, self.player.y, 48, 48)):
+            if entidade is self.boss:
+                dg_nome = DUNGEONS[self.dungeon_index]["nome"]
+                self.combate_atual = Combat(self.player, Enemy(ENEMIES[dg_nome]["boss"]), self.configuracoes.dificuldade, dg_nome, self.sound_manager, self.agenda)
+                self.state = GameState.COMBAT
+                break
 
     def handle_combat(self, keys):
+        self.agenda.atualizar()
         if self.combate_atual.em_menu:
             if self.input_manager.is_key_pressed(pygame.K_LEFT):
                 self.sound_manager.play_sound("select")
@@ -822,15 +955,14 @@ class Game:
                 elif op == "Fugir":
                     if self.combate_atual.tentar_fugir():
                         self.state = GameState.PLAYING
-                        self.combate_atual = None
+                        self.encerrar_combate()
                         self.sound_manager.stop_music()
                         self.sound_manager.play_music("dungeon_ambient")
         
         if self.combate_atual and not self.combate_atual.enemy.esta_vivo():
             if self.combate_atual.enemy.nome == self.boss.nome:
-                self.state = GameState.TRANSITION
-                self.transition_timer = 180
-                self.combate_atual = None
+                self.iniciar_transicao(self.dungeon_index + 1, DURACAO_TRANSICAO)
+                self.encerrar_combate()
                 self.sound_manager.stop_music()
             else:
                 self.inimigos_mortos += 1
@@ -849,20 +981,19 @@ class Game:
                         else: msgs.append(f"Item desc.: {valor}")
                 if msgs:
                     self.mensagem_acao = " | ".join(msgs)
-                    self.mensagem_timer = 180
+                    self.mensagem_ate = time.monotonic() + DURACAO_MENSAGEM_DROP
                 self.state = GameState.PLAYING
-                self.combate_atual = None
+                self.encerrar_combate()
                 self.sound_manager.play_music("dungeon_ambient")
                 
-        elif self.combate_atual and not self.combate_atual.em_menu and self.combate_atual.animacao_timer == 0:
-            self.combate_atual.turno = "enemy"
-            pygame.time.wait(500)
-            self.combate_atual.ataque_inimigo()
-            self.combate_atual.turno = "player"
-            self.combate_atual.em_menu = True
-            if not self.combate_atual.player.esta_vivo():
-                self.state = GameState.GAME_OVER
-                self.sound_manager.stop_music()
+        elif self.combate_atual and not self.combate_atual.player.esta_vivo():
+            self.state = GameState.GAME_OVER
+            self.sound_manager.stop_music()
+
+    def encerrar_combate(self):
+        """Descarta o combate atual e o turno do inimigo que ele ainda tinha agendado"""
+        self.agenda.limpar()
+        self.combate_atual = None
 
     def handle_name_input(self, event):
         if event.key == pygame.K_RETURN:
@@ -878,50 +1009,68 @@ class Game:
             if len(self.nome_input) < 15:
                 self.nome_input += event.unicode
 
-    def render_to_screen(self):
-        target_w, target_h = self.screen.get_width(), self.screen.get_height()
-        scale_w = target_w / VIRTUAL_WIDTH
-        scale_h = target_h / VIRTUAL_HEIGHT
-        scale = min(scale_w, scale_h)
+    def alpha_brilho(self, brilho):
+        return int(255 * (1 - (brilho / 100.0)))
+
+    def preparar_present(self, target_w, target_h):
+        scale = min(target_w / VIRTUAL_WIDTH, target_h / VIRTUAL_HEIGHT)
         new_w = int(VIRTUAL_WIDTH * scale)
         new_h = int(VIRTUAL_HEIGHT * scale)
-        offset_x = (target_w - new_w) // 2
-        offset_y = (target_h - new_h) // 2
-        if self.configuracoes.brilho < 100:
-            darkness = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
-            darkness.fill((0, 0, 0))
-            alpha = 255 * (1 - (self.configuracoes.brilho / 100.0))
-            darkness.set_alpha(int(alpha))
+        self.present_rect = pygame.Rect((target_w - new_w) // 2, (target_h - new_h) // 2, new_w, new_h)
+        if (new_w, new_h) == (VIRTUAL_WIDTH, VIRTUAL_HEIGHT):
+            self.tela_escalada = None
+        else:
+            self.tela_escalada = pygame.Surface((new_w, new_h), 0, self.virtual_surface)
+        self.tamanho_janela = (target_w, target_h)
+        # Com double buffering os dois buffers precisam ter as barras limpas
+        self.barras_pendentes = 2
+
+    def render_to_screen(self):
+        target_w, target_h = self.screen.get_size()
+        if (target_w, target_h) != self.tamanho_janela:
+            self.preparar_present(target_w, target_h)
+        if self.configuracoes.brilho != self.brilho_aplicado:
+            # Só o overlay do brilho antigo deixa de ser útil
+            overlays.descartar((VIRTUAL_WIDTH, VIRTUAL_HEIGHT), BLACK, self.alpha_brilho(self.brilho_aplicado))
+            self.brilho_aplicado = self.configuracoes.brilho
+        if self.brilho_aplicado < 100:
+            darkness = overlay((VIRTUAL_WIDTH, VIRTUAL_HEIGHT), BLACK, self.alpha_brilho(self.brilho_aplicado))
             self.virtual_surface.blit(darkness, (0, 0))
-        scaled_surf = pygame.transform.scale(self.virtual_surface, (new_w, new_h))
-        self.screen.fill(BLACK)
-        self.screen.blit(scaled_surf, (offset_x, offset_y))
+        if self.barras_pendentes:
+            self.screen.fill(BLACK)
+            self.barras_pendentes -= 1
+        if self.tela_escalada is None:
+            self.screen.blit(self.virtual_surface, self.present_rect)
+        else:
+            pygame.transform.scale(self.virtual_surface, self.present_rect.size, self.tela_escalada)
+            self.screen.blit(self.tela_escalada, self.present_rect)
+
+    def botao_menu_rect(self, i):
+        start_y, btn_h, btn_w, gap = 320, 70, 400, 25
+        btn_rect = pygame.Rect(0, 0, btn_w, btn_h)
+        btn_rect.center = (VIRTUAL_WIDTH // 2, start_y + i * (btn_h + gap))
+        return btn_rect
 
     def draw_menu(self):
         w, h = VIRTUAL_WIDTH, VIRTUAL_HEIGHT
         if self.menu_background:
             self.virtual_surface.blit(self.menu_background, (0, 0))
-            overlay = pygame.Surface((w, h))
-            overlay.set_alpha(80)
-            overlay.fill(BLACK)
-            self.virtual_surface.blit(overlay, (0, 0))
+            self.virtual_surface.blit(overlay((w, h), BLACK, 80), (0, 0))
         else: self.virtual_surface.fill((20, 15, 30))
         
         titulo_txt = "BEYOND THE DUNGEON"
         offsets = [(-3, -3), (3, -3), (-3, 3), (3, 3)]
         for ox, oy in offsets:
-            sombra = self.font_large.render(titulo_txt, False, BLACK)
+            sombra = render_texto(self.font_large, titulo_txt, False, BLACK)
             rect_s = sombra.get_rect(center=(w // 2 + ox, 130 + oy))
             self.virtual_surface.blit(sombra, rect_s)
-        titulo = self.font_large.render(titulo_txt, False, GOLD)
+        titulo = render_texto(self.font_large, titulo_txt, False, GOLD)
         rect_titulo = titulo.get_rect(center=(w // 2, 130))
         self.virtual_surface.blit(titulo, rect_titulo)
         
-        start_y, btn_h, btn_w, gap = 320, 70, 400, 25
         for i, op in enumerate(self.menu_opcoes):
-            cx, cy = w // 2, start_y + i * (btn_h + gap)
-            btn_rect = pygame.Rect(0, 0, btn_w, btn_h)
-            btn_rect.center = (cx, cy)
+            btn_rect = self.botao_menu_rect(i)
+            cx, cy = btn_rect.center
             if i == self.menu_selecionado:
                 cor_bg, cor_border, cor_txt, texto = (120, 30, 30), GOLD, WHITE, f"> {op} <"
                 pygame.draw.rect(self.virtual_surface, (255, 200, 0), btn_rect, 4, border_radius=10)
@@ -930,8 +1079,8 @@ class Game:
             
             pygame.draw.rect(self.virtual_surface, cor_bg, btn_rect, border_radius=10)
             pygame.draw.rect(self.virtual_surface, cor_border, btn_rect, 2, border_radius=10)
-            txt_surf = self.font_medium.render(texto, False, cor_txt)
-            txt_sombra = self.font_medium.render(texto, False, BLACK)
+            txt_surf = render_texto(self.font_medium, texto, False, cor_txt)
+            txt_sombra = render_texto(self.font_medium, texto, False, BLACK)
             rect_txt = txt_surf.get_rect(center=(cx, cy))
             self.virtual_surface.blit(txt_sombra, (rect_txt.x + 2, rect_txt.y + 2))
             self.virtual_surface.blit(txt_surf, rect_txt)
@@ -939,35 +1088,105 @@ class Game:
 
     def draw_paused(self):
         self.draw_playing()
-        overlay = pygame.Surface((VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill(BLACK)
-        self.virtual_surface.blit(overlay, (0, 0))
-        txt_paused = self.font_large.render("JOGO PAUSADO", False, GOLD)
+        self.virtual_surface.blit(overlay((VIRTUAL_WIDTH, VIRTUAL_HEIGHT), BLACK, 150), (0, 0))
+        txt_paused = render_texto(self.font_large, "JOGO PAUSADO", False, GOLD)
         rect_paused = txt_paused.get_rect(center=(VIRTUAL_WIDTH//2, VIRTUAL_HEIGHT//2 - 50))
         self.virtual_surface.blit(txt_paused, rect_paused)
-        txt_resume = self.font_medium.render("ESC - Voltar", False, WHITE)
+        txt_resume = render_texto(self.font_medium, "ESC - Voltar", False, WHITE)
         rect_resume = txt_resume.get_rect(center=(VIRTUAL_WIDTH//2, VIRTUAL_HEIGHT//2 + 20))
         self.virtual_surface.blit(txt_resume, rect_resume)
-        txt_quit = self.font_medium.render("Q - Menu Principal", False, RED)
+        txt_quit = render_texto(self.font_medium, "Q - Menu Principal", False, RED)
         rect_quit = txt_quit.get_rect(center=(VIRTUAL_WIDTH//2, VIRTUAL_HEIGHT//2 + 60))
         self.virtual_surface.blit(txt_quit, rect_quit)
 
+    def progresso_transicao(self):
+        pct = 1 - (self.transicao_restante() / DURACAO_TRANSICAO)
+        if self.destino_transicao < len(DUNGEONS):
+            pct = min(pct, self.dungeon_loader.progresso(self.destino_transicao))
+        return pct
+
     def draw_transition(self):
         self.virtual_surface.fill(BLACK)
+        if self.inicio_novo_jogo is not None:
+            nome = DUNGEONS[self.destino_transicao]["nome"]
+            texto = render_texto(self.font_medium, f"Carregando {nome}...", True, WHITE)
+            self.virtual_surface.blit(texto, texto.get_rect(center=(VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2 + 50)))
+            self.draw_barra_transicao()
+            return
         nome_atual = DUNGEONS[self.dungeon_index]["nome"]
-        texto_concluido = self.font_large.render(f"{nome_atual} Concluída!", True, GREEN)
+        texto_concluido = render_texto(self.font_large, f"{nome_atual} Concluída!", True, GREEN)
         self.virtual_surface.blit(texto_concluido, texto_concluido.get_rect(center=(VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2 - 50)))
         if self.dungeon_index + 1 < len(DUNGEONS):
             prox_nome = DUNGEONS[self.dungeon_index + 1]["nome"]
-            texto_prox = self.font_medium.render(f"Próxima: {prox_nome}", True, WHITE)
+            texto_prox = render_texto(self.font_medium, f"Próxima: {prox_nome}", True, WHITE)
             self.virtual_surface.blit(texto_prox, texto_prox.get_rect(center=(VIRTUAL_WIDTH // 2, VIRTUAL_HEIGHT // 2 + 50)))
+        self.draw_barra_transicao()
+
+    def draw_barra_transicao(self):
         width_bar = 400
         pygame.draw.rect(self.virtual_surface, GRAY, (VIRTUAL_WIDTH//2 - width_bar//2, VIRTUAL_HEIGHT//2 + 150, width_bar, 20))
-        pct = 1 - (self.transition_timer / 180)
+        pct = self.progresso_transicao()
         pygame.draw.rect(self.virtual_surface, GOLD, (VIRTUAL_WIDTH//2 - width_bar//2, VIRTUAL_HEIGHT//2 + 150, width_bar * pct, 20))
 
+    def regioes_estado(self):
+        """(retângulo virtual, assinatura) de cada região que pode mudar na tela estática atual"""
+        if self.state == GameState.MENU:
+            if self.ranking_ui.visivel:
+                return [(TELA_INTEIRA, ("ranking", self.ranking_manager.versao))]
+            return [(tuple(self.botao_menu_rect(i)), i == self.menu_selecionado) for i in range(len(self.menu_opcoes))]
+        if self.state == GameState.SETTINGS:
+            valores = tuple(self.tela_config.obter_valor_opcao(op) for op in self.tela_config.opcoes)
+            return [(TELA_INTEIRA, self.tela_config.visivel), (self.tela_config.painel_rect(), (self.tela_config.selecionado, valores))]
+        if self.state == GameState.TRANSITION:
+            width_bar = 400
+            barra = (VIRTUAL_WIDTH//2 - width_bar//2, VIRTUAL_HEIGHT//2 + 150, width_bar, 20)
+            return [(TELA_INTEIRA, (self.dungeon_index, self.destino_transicao)), (barra, int(width_bar * self.progresso_transicao()))]
+        if self.state in (GameState.GAME_OVER, GameState.VICTORY):
+            info = (0, VIRTUAL_HEIGHT//2 - 30, VIRTUAL_WIDTH, 60)
+            nome = (0, VIRTUAL_HEIGHT//2 + 70, VIRTUAL_WIDTH, 100)
+            return [(TELA_INTEIRA, None), (info, (self.inimigos_mortos, int(time.time() - self.tempo_inicio))), (nome, self.nome_input)]
+        return [(TELA_INTEIRA, None)]
+
+    def para_tela(self, rect):
+        """Converte um retângulo da surface virtual para a janela, com folga de arredondamento"""
+        escala = self.present_rect.width / VIRTUAL_WIDTH
+        x, y, w, h = rect
+        return pygame.Rect(self.present_rect.x + int(x * escala), self.present_rect.y + int(y * escala),
+                           int(w * escala) + 1, int(h * escala) + 1).inflate(2, 2)
+
+    def draw_parcial(self):
+        regioes = dict(self.regioes_estado())
+        contexto = (self.state, self.configuracoes.brilho, self.screen.get_size())
+        anterior = self.regioes_desenhadas
+        sujas = None
+        if (anterior is not None and contexto == self.contexto_desenhado and anterior.keys() == regioes.keys()
+                and not self.barras_pendentes):
+            sujas = [pygame.Rect(rect) for rect, assinatura in regioes.items() if anterior[rect] != assinatura]
+            if not sujas:
+                return
+        self.regioes_desenhadas = regioes
+        self.contexto_desenhado = contexto
+
+        if sujas:
+            self.virtual_surface.set_clip(sujas[0].unionall(sujas[1:]))
+        self.desenhar_estado()
+        self.render_to_screen()
+        self.virtual_surface.set_clip(None)
+        if sujas:
+            pygame.display.update([self.para_tela(rect) for rect in sujas])
+        else:
+            pygame.display.flip()
+
     def draw(self):
+        if self.configuracoes.renderizacao_parcial and self.state in ESTADOS_ESTATICOS:
+            self.draw_parcial()
+            return
+        self.regioes_desenhadas = None
+        self.desenhar_estado()
+        self.render_to_screen()
+        pygame.display.flip()
+
+    def desenhar_estado(self):
         if self.state == GameState.MENU: self.draw_menu()
         elif self.state == GameState.PLAYING: self.draw_playing()
         elif self.state == GameState.PAUSED: self.draw_paused()
@@ -978,29 +1197,26 @@ class Game:
         elif self.state == GameState.SETTINGS:
             self.draw_menu()
             self.tela_config.draw(self.virtual_surface)
-        self.render_to_screen()
-        pygame.display.flip()
 
     def draw_playing(self):
-        d_img = pygame.transform.scale(self.dungeon_image, (DUNGEON_SIZE, DUNGEON_SIZE))
-        self.virtual_surface.blit(d_img, (-self.camera_x, -self.camera_y))
-        boss_screen_x = self.boss.x - self.camera_x
-        boss_screen_y = self.boss.y - self.camera_y
-        self.virtual_surface.blit(self.boss.sprite, (boss_screen_x, boss_screen_y))
+        # A imagem já está em DUNGEON_SIZE desde o carregamento; só a área da câmera é copiada
+        self.virtual_surface.blit(self.dungeon_image, (0, 0), (self.camera_x, self.camera_y, VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+        visiveis = self.entidades.consultar((self.camera_x, self.camera_y, VIRTUAL_WIDTH, VIRTUAL_HEIGHT))
+        self.virtual_surface.blits([(entidade.sprite, (entidade.x - self.camera_x, entidade.y - self.camera_y))
+                                    for entidade in sorted(visiveis, key=lambda e: e.y)], doreturn=False)
         self.player.draw(self.virtual_surface, self.camera_x, self.camera_y)
-        self.hud.draw_all(self.virtual_surface, self.player, self.dungeon_index, len(DUNGEONS), self.mensagem_acao, self.mensagem_timer)
-        if self.mensagem_timer > 0: self.mensagem_timer -= 1
+        self.hud.draw_all(self.virtual_surface, self.player, self.dungeon_index, len(DUNGEONS), self.mensagem_acao, self.mensagem_ate - time.monotonic())
         self.inventario_ui.draw(self.virtual_surface)
 
     def draw_input_screen(self, title, color):
         self.virtual_surface.fill(BLACK)
-        t = self.font_large.render(title, False, color)
+        t = render_texto(self.font_large, title, False, color)
         self.virtual_surface.blit(t, t.get_rect(center=(VIRTUAL_WIDTH//2, VIRTUAL_HEIGHT//2 - 100)))
-        info = self.font_medium.render(f"Inimigos: {self.inimigos_mortos} | Tempo: {int(time.time() - self.tempo_inicio)}s", False, WHITE)
+        info = render_texto(self.font_medium, f"Inimigos: {self.inimigos_mortos} | Tempo: {int(time.time() - self.tempo_inicio)}s", False, WHITE)
         self.virtual_surface.blit(info, info.get_rect(center=(VIRTUAL_WIDTH//2, VIRTUAL_HEIGHT//2)))
-        prompt = self.font_small.render("Digite seu nome e aperte ENTER:", False, GRAY)
+        prompt = render_texto(self.font_small, "Digite seu nome e aperte ENTER:", False, GRAY)
         self.virtual_surface.blit(prompt, prompt.get_rect(center=(VIRTUAL_WIDTH//2, VIRTUAL_HEIGHT//2 + 60)))
-        name_surf = self.font_large.render(self.nome_input + "_", False, GOLD)
+        name_surf = render_texto(self.font_large, self.nome_input + "_", False, GOLD)
         self.virtual_surface.blit(name_surf, name_surf.get_rect(center=(VIRTUAL_WIDTH//2, VIRTUAL_HEIGHT//2 + 120)))
 
     def draw_game_over(self):
@@ -1009,6 +1225,18 @@ class Game:
     def draw_victory(self):
         self.draw_input_screen("VITÓRIA!", GOLD)
 
+    def aplicar_resize_pendente(self):
+        """Recria a janela só quando o arrasto termina, não a cada VIDEORESIZE"""
+        if self.resize_pendente is None:
+            return
+        if pygame.time.get_ticks() - self.resize_ticks < RESIZE_DEBOUNCE_MS:
+            return
+        self.configuracoes.resolucao = self.resize_pendente
+        self.resize_pendente = None
+        self.screen = pygame.display.set_mode(self.configuracoes.resolucao, pygame.RESIZABLE)
+        self.tamanho_janela = None
+        overlays.limpar()
+
     def run(self):
         while self.running:
             self.delta_time = self.clock.tick(FPS) / 1000.0
@@ -1017,11 +1245,14 @@ class Game:
                 if event.type == pygame.QUIT: self.running = False
                 elif event.type == pygame.VIDEORESIZE:
                     if not self.configuracoes.fullscreen:
-                        self.configuracoes.resolucao = (event.w, event.h)
-                        self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                        self.resize_pendente = (event.w, event.h)
+                        self.resize_ticks = pygame.time.get_ticks()
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.regioes_desenhadas = None
                 elif event.type == pygame.KEYDOWN:
                     if self.state in [GameState.GAME_OVER, GameState.VICTORY]:
                         self.handle_name_input(event)
+            self.aplicar_resize_pendente()
             keys = pygame.key.get_pressed()
             self.input_manager.update(keys)
             
@@ -1033,9 +1264,13 @@ class Game:
             elif self.state == GameState.TRANSITION: self.handle_transition(keys)
             elif self.state == GameState.SETTINGS: self.handle_settings(keys)
             
-            if self.combate_atual and self.combate_atual.animacao_timer > 0:
-                self.combate_atual.animacao_timer -= 1
             self.draw()
+            if self.relatorio_inicio:
+                self.relatorio_inicio.marcar("primeiro frame")
+                self.relatorio_inicio.imprimir()
+                self.relatorio_inicio = None
+                # Menu na tela: o resto do jogo carrega enquanto o jogador escolhe
+                self.dungeon_loader.solicitar(0)
 
 if __name__ == "__main__":
     game = Game()
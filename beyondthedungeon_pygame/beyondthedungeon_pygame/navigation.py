@@ -0,0 +1,249 @@
+from collections import deque
+import numpy as np
+
+INF = np.iinfo(np.int32).max
+
+# (linha, coluna) dos vizinhos em vizinhança 4
+VIZINHOS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def propagar(walkable, origem, limite):
+    """BFS em frentes de onda a partir de `origem`, até `limite` passos"""
+    distancia = np.full(walkable.shape, INF, dtype=np.int32)
+    fronteira = np.zeros(walkable.shape, dtype=bool)
+    fronteira[origem] = True
+    distancia[origem] = 0
+
+    for passo in range(1, limite + 1):
+        vizinhos = np.zeros_like(fronteira)
+        vizinhos[1:, :] |= fronteira[:-1, :]
+        vizinhos[:-1, :] |= fronteira[1:, :]
+        vizinhos[:, 1:] |= fronteira[:, :-1]
+        vizinhos[:, :-1] |= fronteira[:, 1:]
+        fronteira = vizinhos & walkable & (distancia == INF)
+        if not fronteira.any():
+            break
+        distancia[fronteira] = passo
+    return distancia
+
+
+def direcoes(distancia):
+    """Passo (dx, dy) de cada célula para o vizinho mais próximo da origem"""
+    padded = np.pad(distancia, 1, constant_values=INF)
+    rows, cols = distancia.shape
+    candidatos = np.stack([padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols] for dr, dc in VIZINHOS])
+    melhor = np.argmin(candidatos, axis=0)
+    anda = np.take_along_axis(candidatos, melhor[None], axis=0)[0] < distancia
+    passos = np.array([(dc, dr) for dr, dc in VIZINHOS], dtype=np.int8)
+    return np.where(anda[..., None], passos[melhor], 0).astype(np.int8)
+
+
+def proxima_celula(distancia, passo, row, col):
+    d = distancia[row, col]
+    if d == 0:
+        return None
+    if d != INF:
+        dx, dy = passo[row, col]
+        return (row + int(dy), col + int(dx))
+
+    # Célula bloqueada (a entidade encostou numa parede): usa a melhor vizinha
+    r0, c0 = max(row - 1, 0), max(col - 1, 0)
+    janela = distancia[r0:row + 2, c0:col + 2]
+    if janela.min() == INF:
+        return None
+    dr, dc = np.unravel_index(np.argmin(janela), janela.shape)
+    return (r0 + int(dr), c0 + int(dc))
+
+
+class NavGrid:
+    """Grade grossa de navegação derivada do CollisionMap.
+
+    Cada setor (sector_size x sector_size células) é dividido em regiões
+    conexas; regiões vizinhas são ligadas por portais e formam o grafo usado
+    para caminhos longos.
+    """
+    def __init__(self, collision_map, cell_size=16, footprint=48, sector_size=16):
+        self.cell_size = cell_size
+        self.footprint = footprint
+        self.sector_size = sector_size
+        size = collision_map.dungeon_size if collision_map else 0
+        self.rows = self.cols = -(-size // cell_size)
+
+        # Uma célula é andável se a caixa da entidade, centrada nela, cabe no mapa
+        centers = np.arange(self.cols) * cell_size + cell_size // 2 - footprint // 2
+        ys, xs = np.meshgrid(centers, centers, indexing='ij')
+        if collision_map:
+            self.walkable = collision_map.is_passable_many(xs, ys, footprint, footprint)
+        else:
+            self.walkable = np.ones((self.rows, self.cols), dtype=bool)
+
+        self.regioes = np.full((self.rows, self.cols), -1, dtype=np.int32)
+        self.setor_da_regiao = []
+        # (região, região vizinha) -> célula de entrada na vizinha
+        self.portais = {}
+        self.vizinhas = {}
+        # (região, próxima região) -> campo local até o portal, calculado sob demanda
+        self.campos_locais = {}
+        self.build_regioes()
+        self.build_portais()
+
+    def celula(self, x, y):
+        row = min(max(int(y) // self.cell_size, 0), self.rows - 1)
+        col = min(max(int(x) // self.cell_size, 0), self.cols - 1)
+        return row, col
+
+    def centro(self, row, col):
+        return (col * self.cell_size + self.cell_size // 2, row * self.cell_size + self.cell_size // 2)
+
+    def limites_setor(self, regiao):
+        sr, sc = self.setor_da_regiao[regiao]
+        n = self.sector_size
+        return sr * n, sc * n, min((sr + 1) * n, self.rows), min((sc + 1) * n, self.cols)
+
+    def regiao(self, row, col):
+        regiao = int(self.regioes[row, col])
+        if regiao >= 0:
+            return regiao
+        janela = self.regioes[max(row - 1, 0):row + 2, max(col - 1, 0):col + 2]
+        validas = janela[janela >= 0]
+        return int(validas[0]) if len(validas) else -1
+
+    def build_regioes(self):
+        n = self.sector_size
+        for sr in range(-(-self.rows // n)):
+            for sc in range(-(-self.cols // n)):
+                r0, c0 = sr * n, sc * n
+                r1, c1 = min(r0 + n, self.rows), min(c0 + n, self.cols)
+                for row, col in zip(*np.nonzero(self.walkable[r0:r1, c0:c1])):
+                    inicio = (r0 + int(row), c0 + int(col))
+                    if self.regioes[inicio] >= 0:
+                        continue
+                    regiao = len(self.setor_da_regiao)
+                    self.setor_da_regiao.append((sr, sc))
+                    self.regioes[inicio] = regiao
+                    fila = deque([inicio])
+                    while fila:
+                        r, c = fila.popleft()
+                        for dr, dc in VIZINHOS:
+                            nr, nc = r + dr, c + dc
+                            if r0 <= nr < r1 and c0 <= nc < c1 and self.walkable[nr, nc] and self.regioes[nr, nc] < 0:
+                                self.regioes[nr, nc] = regiao
+                                fila.append((nr, nc))
+
+    def build_portais(self):
+        """Liga regiões vizinhas pela travessia andável mais central da fronteira"""
+        travessias = {}
+        n, reg = self.sector_size, self.regioes
+        for borda in range(n, self.cols, n):
+            for row in np.flatnonzero((reg[:, borda - 1] >= 0) & (reg[:, borda] >= 0)):
+                a, b = int(reg[row, borda - 1]), int(reg[row, borda])
+                travessias.setdefault((a, b), []).append(((int(row), borda - 1), (int(row), borda)))
+        for borda in range(n, self.rows, n):
+            for col in np.flatnonzero((reg[borda - 1, :] >= 0) & (reg[borda, :] >= 0)):
+                a, b = int(reg[borda - 1, col]), int(reg[borda, col])
+                travessias.setdefault((a, b), []).append(((borda - 1, int(col)), (borda, int(col))))
+
+        for (a, b), pares in travessias.items():
+            celula_a, celula_b = pares[len(pares) // 2]
+            self.portais[(a, b)] = celula_b
+            self.portais[(b, a)] = celula_a
+            self.vizinhas.setdefault(a, set()).add(b)
+            self.vizinhas.setdefault(b, set()).add(a)
+
+    def campo_local(self, regiao, proxima):
+        chave = (regiao, proxima)
+        if chave not in self.campos_locais:
+            r0, c0, r1, c1 = self.limites_setor(regiao)
+            r0, c0 = max(r0 - 1, 0), max(c0 - 1, 0)
+            r1, c1 = min(r1 + 1, self.rows), min(c1 + 1, self.cols)
+            portal = self.portais[chave]
+            andavel = self.regioes[r0:r1, c0:c1] == regiao
+            origem = (portal[0] - r0, portal[1] - c0)
+            andavel[origem] = True
+            distancia = propagar(andavel, origem, andavel.size)
+            self.campos_locais[chave] = (r0, c0, distancia, direcoes(distancia))
+        return self.campos_locais[chave]
+
+
+class FlowField:
+    """Campo de direções até um alvo, compartilhado por todos os perseguidores.
+
+    O campo fino cobre até `raio` células do alvo; além dele, o caminho segue
+    pelo grafo de regiões. Mudar o alvo só marca o campo como sujo: ele é
+    recalculado inteiro na próxima consulta, então sem perseguidores não custa nada.
+    """
+    def __init__(self, nav_grid, raio=40):
+        self.nav = nav_grid
+        self.raio = raio
+        self.alvo = None
+        self.regiao_alvo = None
+        self.distancia = np.full((nav_grid.rows, nav_grid.cols), INF, dtype=np.int32)
+        self.passo = np.zeros((nav_grid.rows, nav_grid.cols, 2), dtype=np.int8)
+        self.distancia_regioes = {}
+        self.sujo = False
+
+    def atualizar(self, x, y):
+        celula = self.nav.celula(x, y)
+        if celula == self.alvo:
+            return False
+        self.alvo = celula
+        self.sujo = True
+        return True
+
+    def recalcular(self):
+        self.sujo = False
+        celula = self.alvo
+        self.distancia = propagar(self.nav.walkable, celula, self.raio)
+        self.passo = direcoes(self.distancia)
+
+        regiao = self.nav.regiao(*celula)
+        if regiao != self.regiao_alvo:
+            self.regiao_alvo = regiao
+            self.calcular_regioes()
+
+    def calcular_regioes(self):
+        self.distancia_regioes = {}
+        if self.regiao_alvo < 0:
+            return
+        self.distancia_regioes[self.regiao_alvo] = 0
+        fila = deque([self.regiao_alvo])
+        while fila:
+            regiao = fila.popleft()
+            for vizinha in self.nav.vizinhas.get(regiao, ()):
+                if vizinha not in self.distancia_regioes:
+                    self.distancia_regioes[vizinha] = self.distancia_regioes[regiao] + 1
+                    fila.append(vizinha)
+
+    def direcao(self, x, y):
+        """Vetor unitário (dx, dy) que leva a posição (x, y) em direção ao alvo"""
+        if self.alvo is None:
+            return (0.0, 0.0)
+        if self.sujo:
+            self.recalcular()
+        row, col = self.nav.celula(x, y)
+        proxima = proxima_celula(self.distancia, self.passo, row, col)
+        if proxima is None and self.distancia[row, col] != 0:
+            proxima = self.rumo_por_regioes(row, col)
+        if proxima is None:
+            return (0.0, 0.0)
+
+        # Mira no centro da próxima célula para se manter no meio dos corredores
+        px, py = self.nav.centro(*proxima)
+        dx, dy = px - x, py - y
+        norma = (dx * dx + dy * dy) ** 0.5
+        return (dx / norma, dy / norma) if norma else (0.0, 0.0)
+
+    def rumo_por_regioes(self, row, col):
+        """Fora do raio do campo fino: segue o campo local até o portal da próxima região"""
+        regiao = self.nav.regiao(row, col)
+        distancia = self.distancia_regioes.get(regiao)
+        if not distancia:
+            return None
+        for vizinha in self.nav.vizinhas.get(regiao, ()):
+            if self.distancia_regioes.get(vizinha) == distancia - 1:
+                r0, c0, distancia_local, passo_local = self.nav.campo_local(regiao, vizinha)
+                celula = proxima_celula(distancia_local, passo_local, row - r0, col - c0)
+                if celula is None:
+                    return self.nav.portais[(regiao, vizinha)]
+                return (celula[0] + r0, celula[1] + c0)
+        return None
@@ -1,6 +1,7 @@
 import pickle
 import os
 import pygame
+from render_cache import fonte, overlay, render_texto
 from datetime import datetime
 
 
@@ -9,6 +10,8 @@ class RankingManager:
     def __init__(self, filename="ranking.dat"):
         self.filename = filename
         self.rankings = []
+        # Incrementada a cada mudança da tabela, para quem guarda versões desenhadas
+        self.versao = 0
         self.load_rankings()
     
     def load_rankings(self):
@@ -56,6 +59,7 @@ class RankingManager:
         self.rankings.append(novo_ranking)
         self.rankings.sort(key=lambda x: x["pontuacao"], reverse=True)
         self.rankings = self.rankings[:10]
+        self.versao += 1
         self.save_rankings()
         return novo_ranking
     
@@ -64,6 +68,7 @@ class RankingManager:
     
     def limpar_rankings(self):
         self.rankings = []
+        self.versao += 1
         self.save_rankings()
 
 
@@ -96,31 +101,34 @@ class RankingUI:
         self.font_small = None
         self.font_bold = None
 
+        # Tabela já desenhada e a (tabela, versão) a que ela corresponde
+        self.painel = None
+        self.painel_rect = None
+        self.versao_painel = None
+
     def carregar_fontes(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        font_path = os.path.join(base_dir, "assets", "BoldPixels.ttf")
-        
-        if os.path.exists(font_path):
-            self.font_large = pygame.font.Font(font_path, 60)
-            self.font_medium = pygame.font.Font(font_path, 32)
-            self.font_small = pygame.font.Font(font_path, 26)
-            self.font_bold = pygame.font.Font(font_path, 28)
-        else:
-            self.font_large = pygame.font.Font(None, 60)
-            self.font_medium = pygame.font.Font(None, 32)
-            self.font_small = pygame.font.Font(None, 26)
-            self.font_bold = pygame.font.Font(None, 28)
+        self.font_large = fonte(60)
+        self.font_medium = fonte(32)
+        self.font_small = fonte(26)
+        self.font_bold = fonte(28)
         self.font_loaded = True
     
     def draw(self, screen, ranking_manager):
         if not self.visivel: return
         if not self.font_loaded: self.carregar_fontes()
-        
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(220)
-        overlay.fill(self.BLACK)
-        screen.blit(overlay, (0, 0))
-        
+
+        versao = (id(ranking_manager), ranking_manager.versao)
+        if versao != self.versao_painel:
+            self.painel = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            self.desenhar_tabela(self.painel, ranking_manager)
+            # O texto de cabeçalho pode passar da borda do painel
+            self.painel_rect = self.painel.get_bounding_rect()
+            self.versao_painel = versao
+
+        screen.blit(overlay((self.screen_width, self.screen_height), self.BLACK, 220), (0, 0))
+        screen.blit(self.painel, self.painel_rect, self.painel_rect)
+
+    def desenhar_tabela(self, screen, ranking_manager):
         panel_width = 950
         panel_height = 650
         panel_x = (self.screen_width - panel_width) // 2
@@ -131,8 +139,8 @@ class RankingUI:
         pygame.draw.rect(screen, self.DARK_GOLD, (panel_x+4, panel_y+4, panel_width-8, panel_height-8), 2, border_radius=12)
         
         titulo_txt = "HALL DA FAMA"
-        titulo_sombra = self.font_large.render(titulo_txt, False, self.BLACK)
-        titulo = self.font_large.render(titulo_txt, False, self.GOLD)
+        titulo_sombra = render_texto(self.font_large, titulo_txt, False, self.BLACK)
+        titulo = render_texto(self.font_large, titulo_txt, False, self.GOLD)
         titulo_rect = titulo.get_rect(center=(self.screen_width // 2, panel_y + 45))
         
         screen.blit(titulo_sombra, (titulo_rect.x + 3, titulo_rect.y + 3))
@@ -147,7 +155,7 @@ class RankingUI:
         headers = ["Pos", "Nome", "Pontos", "Tempo", "Inimigos", "Dificuldade"]
         
         for header, x_pos in zip(headers, col_x):
-            texto = self.font_bold.render(header.upper(), False, self.BLACK)
+            texto = render_texto(self.font_bold, header.upper(), False, self.BLACK)
             text_rect = texto.get_rect(midleft=(x_pos, header_y + header_height // 2))
             screen.blit(texto, text_rect)
         
@@ -175,10 +183,10 @@ class RankingUI:
             
             def draw_cell(text, x, color=txt_color):
                 if color == self.WHITE:
-                    sombra = self.font_small.render(str(text), False, self.BLACK)
+                    sombra = render_texto(self.font_small, str(text), False, self.BLACK)
                     rect_s = sombra.get_rect(midleft=(x+1, current_row_y + row_height // 2 + 1))
                     screen.blit(sombra, rect_s)
-                surf = self.font_small.render(str(text), False, color)
+                surf = render_texto(self.font_small, str(text), False, color)
                 rect = surf.get_rect(midleft=(x, current_row_y + row_height // 2))
                 screen.blit(surf, rect)
 
@@ -196,13 +204,13 @@ class RankingUI:
             draw_cell(ranking["dificuldade"], col_x[5], color=final_dif_cor)
 
         if not rankings:
-            msg = self.font_medium.render("Nenhum registro. Jogue para entrar no Ranking!", False, self.GRAY)
+            msg = render_texto(self.font_medium, "Nenhum registro. Jogue para entrar no Ranking!", False, self.GRAY)
             msg_rect = msg.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 40))
             screen.blit(msg, msg_rect)
         
         footer_y = panel_y + panel_height - 35
         pygame.draw.line(screen, self.DARK_GOLD, (panel_x + 50, footer_y - 10), (panel_x + panel_width - 50, footer_y - 10), 1)
-        instr = self.font_small.render("Pressione ESC para voltar ao Menu", False, self.GRAY)
+        instr = render_texto(self.font_small, "Pressione ESC para voltar ao Menu", False, self.GRAY)
         instr_rect = instr.get_rect(center=(self.screen_width // 2, footer_y + 10))
         screen.blit(instr, instr_rect)
     
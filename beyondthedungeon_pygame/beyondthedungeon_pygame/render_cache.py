@@ -0,0 +1,149 @@
+import os
+from collections import OrderedDict
+import pygame
+from bundle import BASE_DIR, abrir
+FONTE_JOGO = os.path.join(BASE_DIR, "assets", "BoldPixels.ttf")
+
+
+class ScaledSpriteCache:
+    """Cache LRU de sprites redimensionados, com limite de memória"""
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes_usados = 0
+        self.itens = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def obter(self, surface, size, suave=False):
+        size = (int(size[0]), int(size[1]))
+        chave = (surface, size, suave)
+        entrada = self.itens.get(chave)
+        if entrada is not None:
+            self.itens.move_to_end(chave)
+            self.hits += 1
+            return entrada[0]
+
+        self.misses += 1
+        if surface.get_size() == size:
+            escalada = surface
+        elif suave and surface.get_bitsize() >= 24:
+            escalada = pygame.transform.smoothscale(surface, size)
+        else:
+            escalada = pygame.transform.scale(surface, size)
+
+        # A própria surface de origem não conta como memória extra
+        tamanho = 0 if escalada is surface else escalada.get_width() * escalada.get_height() * escalada.get_bytesize()
+        self.itens[chave] = (escalada, tamanho)
+        self.bytes_usados += tamanho
+        while self.bytes_usados > self.max_bytes and len(self.itens) > 1:
+            _, (_, liberado) = self.itens.popitem(last=False)
+            self.bytes_usados -= liberado
+        return escalada
+
+    def limpar(self):
+        self.itens.clear()
+        self.bytes_usados = 0
+
+
+sprites_escalados = ScaledSpriteCache()
+
+
+def escalar(surface, size, suave=False):
+    return sprites_escalados.obter(surface, size, suave)
+
+
+class TextCache:
+    """Cache LRU de textos já rasterizados, por (fonte, texto, antialias, cor)"""
+    def __init__(self, max_itens=512):
+        self.max_itens = max_itens
+        self.itens = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, texto, antialias, cor):
+        chave = (font, texto, antialias, tuple(cor))
+        surface = self.itens.get(chave)
+        if surface is not None:
+            self.itens.move_to_end(chave)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(texto, antialias, cor)
+        self.itens[chave] = surface
+        if len(self.itens) > self.max_itens:
+            self.itens.popitem(last=False)
+        return surface
+
+    def limpar(self):
+        self.itens.clear()
+
+
+textos = TextCache()
+
+
+def render_texto(font, texto, antialias, cor):
+    return textos.render(font, texto, antialias, cor)
+
+
+class OverlayPool:
+    """Surfaces translúcidas de tela cheia, uma por (tamanho, cor, alpha)"""
+    def __init__(self):
+        self.overlays = {}
+
+    def obter(self, size, cor, alpha):
+        chave = (tuple(size), tuple(cor), int(alpha))
+        overlay = self.overlays.get(chave)
+        if overlay is None:
+            overlay = pygame.Surface(chave[0])
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert()
+            overlay.fill(chave[1])
+            overlay.set_alpha(chave[2])
+            self.overlays[chave] = overlay
+        return overlay
+
+    def descartar(self, size, cor, alpha):
+        self.overlays.pop((tuple(size), tuple(cor), int(alpha)), None)
+
+    def limpar(self):
+        """Chamado quando o modo de vídeo muda e o formato da tela pode ter mudado"""
+        self.overlays.clear()
+
+
+overlays = OverlayPool()
+
+
+def overlay(size, cor, alpha):
+    return overlays.obter(size, cor, alpha)
+
+
+class FontRegistry:
+    """Fontes compartilhadas pelo processo, carregadas sob demanda por (arquivo, tamanho)"""
+    def __init__(self):
+        self.fontes = {}
+        self.arquivos_invalidos = set()
+
+    def obter(self, path, size):
+        chave = (path, size)
+        fonte = self.fontes.get(chave)
+        if fonte is None:
+            fonte = pygame.font.Font(abrir(path) if path else None, size)
+            self.fontes[chave] = fonte
+        return fonte
+
+    def fonte_jogo(self, size, fallback_size=None):
+        if FONTE_JOGO not in self.arquivos_invalidos:
+            try:
+                return self.obter(FONTE_JOGO, size)
+            except (OSError, FileNotFoundError):
+                self.arquivos_invalidos.add(FONTE_JOGO)
+        return self.obter(None, fallback_size or size)
+
+
+fontes = FontRegistry()
+
+
+def fonte(size, fallback_size=None):
+    """BoldPixels no tamanho pedido, ou a fonte padrão do pygame em fallback_size"""
+    return fontes.fonte_jogo(size, fallback_size)
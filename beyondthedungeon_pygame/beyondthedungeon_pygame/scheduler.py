@@ -0,0 +1,33 @@
+import heapq
+import itertools
+import time
+
+
+class Scheduler:
+    """Ações temporizadas em uma fila de prioridade pelo relógio monotônico.
+
+    Nada bloqueia: o loop chama `atualizar` a cada frame e só as ações cujo
+    horário já passou são executadas, na ordem em que vencem.
+    """
+    def __init__(self, relogio=time.monotonic):
+        self.relogio = relogio
+        # (horário, ordem de inserção, ação, args)
+        self.fila = []
+        self.ordem = itertools.count()
+
+    def agora(self):
+        return self.relogio()
+
+    def agendar(self, atraso, acao, *args):
+        """Executa `acao(*args)` daqui a `atraso` segundos"""
+        heapq.heappush(self.fila, (self.agora() + atraso, next(self.ordem), acao, args))
+
+    def limpar(self):
+        """Descarta tudo o que ainda não venceu"""
+        self.fila.clear()
+
+    def atualizar(self):
+        agora = self.agora()
+        while self.fila and self.fila[0][0] <= agora:
+            _, _, acao, args = heapq.heappop(self.fila)
+            acao(*args)
@@ -1,5 +1,5 @@
 import pygame
-import os
+from render_cache import fonte, overlay, render_texto
 
 # Cores
 BLACK = (0, 0, 0)
@@ -23,6 +23,8 @@ class Configuracoes:
         self.musica_ativada = True
         self.efeitos_ativados = True
         self.brilho = 100
+        # Telas estáticas só redesenham e enviam as regiões que mudaram
+        self.renderizacao_parcial = True
         
         self.dificuldades = ["Fácil", "Normal", "Difícil"]
         self.resolucoes = [(1280, 720), (1920, 1080), (800, 600)]
@@ -78,17 +80,9 @@ class TelaConfiguracao:
         self.configuracoes = configuracoes
         self.visivel = False
         
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        font_path = os.path.join(base_dir, "assets", "BoldPixels.ttf")
-        
-        if os.path.exists(font_path):
-            self.font_large = pygame.font.Font(font_path, 48)
-            self.font_medium = pygame.font.Font(font_path, 32)
-            self.font_small = pygame.font.Font(font_path, 24)
-        else:
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 36)
-            self.font_small = pygame.font.Font(None, 28)
+        self.font_large = fonte(48)
+        self.font_medium = fonte(32, 36)
+        self.font_small = fonte(24, 28)
         
         self.opcoes = [
             "Volume Música",
@@ -183,23 +177,22 @@ class TelaConfiguracao:
             
         return False
     
+    def painel_rect(self):
+        painel_largura = 700
+        painel_altura = 650
+        return ((self.screen_width - painel_largura) // 2, (self.screen_height - painel_altura) // 2, painel_largura, painel_altura)
+
     def draw(self, screen):
         if not self.visivel: return
         
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(overlay(screen.get_size(), BLACK, 200), (0, 0))
         
-        painel_largura = 700
-        painel_altura = 650
-        painel_x = (screen.get_width() - painel_largura) // 2
-        painel_y = (screen.get_height() - painel_altura) // 2
+        painel_x, painel_y, painel_largura, painel_altura = self.painel_rect()
         
         pygame.draw.rect(screen, (30, 30, 35), (painel_x, painel_y, painel_largura, painel_altura), border_radius=15)
         pygame.draw.rect(screen, GOLD, (painel_x, painel_y, painel_largura, painel_altura), 3, border_radius=15)
         
-        titulo = self.font_large.render("CONFIGURAÇÕES", True, GOLD)
+        titulo = render_texto(self.font_large, "CONFIGURAÇÕES", True, GOLD)
         rect_titulo = titulo.get_rect(center=(screen.get_width()//2, painel_y + 50))
         screen.blit(titulo, rect_titulo)
         
@@ -207,11 +200,11 @@ class TelaConfiguracao:
         for i, opcao in enumerate(self.opcoes):
             cor = YELLOW if i == self.selecionado else WHITE
             
-            texto_opcao = self.font_medium.render(opcao, True, cor)
+            texto_opcao = render_texto(self.font_medium, opcao, True, cor)
             screen.blit(texto_opcao, (painel_x + 60, opcoes_y + i * 50))
             
             valor = self.obter_valor_opcao(opcao)
-            texto_valor = self.font_small.render(valor, True, cor)
+            texto_valor = render_texto(self.font_small, valor, True, cor)
             
             rect_valor = texto_valor.get_rect(midright=(painel_x + painel_largura - 60, opcoes_y + i * 50 + 15))
             screen.blit(texto_valor, rect_valor)
@@ -219,7 +212,7 @@ class TelaConfiguracao:
             if i == self.selecionado:
                 pygame.draw.rect(screen, cor, (painel_x + 40, opcoes_y + i * 50 + 10, 10, 10))
         
-        instrucoes = self.font_small.render("Setas para Mudar | ENTER/ESC Voltar", True, GRAY)
+        instrucoes = render_texto(self.font_small, "Setas para Mudar | ENTER/ESC Voltar", True, GRAY)
         rect_instr = instrucoes.get_rect(center=(screen.get_width()//2, painel_y + painel_altura - 40))
         screen.blit(instrucoes, rect_instr)
     
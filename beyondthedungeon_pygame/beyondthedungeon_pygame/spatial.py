@@ -0,0 +1,63 @@
+import pygame
+
+
+class SpatialHash:
+    """Índice espacial uniforme de entidades do mundo por retângulo"""
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.celulas = {}
+        self.retangulos = {}
+
+    def intervalo(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, (rect.right - 1) // cs, rect.top // cs, (rect.bottom - 1) // cs)
+
+    def inserir(self, entidade, rect):
+        rect = pygame.Rect(rect)
+        self.retangulos[entidade] = rect
+        c0, c1, r0, r1 = self.intervalo(rect)
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                self.celulas.setdefault((col, row), set()).add(entidade)
+
+    def remover(self, entidade):
+        rect = self.retangulos.pop(entidade, None)
+        if rect is None:
+            return
+        c0, c1, r0, r1 = self.intervalo(rect)
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                celula = self.celulas.get((col, row))
+                if celula:
+                    celula.discard(entidade)
+                    if not celula:
+                        del self.celulas[(col, row)]
+
+    def mover(self, entidade, rect):
+        antigo = self.retangulos.get(entidade)
+        rect = pygame.Rect(rect)
+        if antigo is not None and self.intervalo(antigo) == self.intervalo(rect):
+            antigo.update(rect)
+            return
+        self.remover(entidade)
+        self.inserir(entidade, rect)
+
+    def consultar(self, rect):
+        """Entidades cujo retângulo intersecta `rect`"""
+        rect = pygame.Rect(rect)
+        c0, c1, r0, r1 = self.intervalo(rect)
+        encontradas = set()
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                encontradas.update(self.celulas.get((col, row), ()))
+        return [e for e in encontradas if self.retangulos[e].colliderect(rect)]
+
+    def retangulo(self, entidade):
+        return self.retangulos.get(entidade)
+
+    def limpar(self):
+        self.celulas.clear()
+        self.retangulos.clear()
+
+    def __len__(self):
+        return len(self.retangulos)